@@ -12,6 +12,8 @@ Usage:
 """
 
 import asyncio
+import copy
+import re
 import websockets
 import json
 import time
@@ -39,7 +41,6 @@ def parse_multi_message_content(content, base_user="unknown"):
     if not content or not content.strip():
         return []
     
-    import re
     messages = []
     
     # Use regex to capture all bracketed messages with their content
@@ -190,7 +191,6 @@ def parse_message_content_v2(message):
 def parse_message_content_v1(raw_content):
     """Parse and categorize V1 format message content - returns list of messages"""
     raw_content = raw_content.replace("[system] ", "[Server]: ")
-    import re
 
     if not raw_content:
         return []
@@ -256,7 +256,6 @@ def parse_message_content_v1(raw_content):
         result["from"] = from_user
     return [result]
 
-import copy
 def parse_message_content(message):
     """Parse message content - handles both V1 and V2 formats"""
     format_version = detect_message_format(message)
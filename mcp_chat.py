@@ -8,6 +8,7 @@ import sys
 from dataclasses import dataclass
 
 import logging
+import logging.handlers
 
 logging.getLogger("mcp.server.lowlevel.server").setLevel(logging.WARNING)
 
@@ -20,12 +21,17 @@ from chains.mcp_utils import (
     create_tool_functions,
 )
 import os
-import json
+import orjson
+import datetime
+import pathlib
+import random
 
 import asyncio
 import sys
 import io
+import queue
 import threading
+from collections import deque
 from contextlib import redirect_stdout, contextmanager
 from typing import Callable, Any
 import functools
@@ -35,25 +41,133 @@ import contextvars
 # Import WebSocket server functionality from chat_log_sender
 from chat_log_sender import ChatLogServer
 
-# Global message queue for live WebSocket broadcasting
-live_message_queue = asyncio.Queue()
-msg_queue = asyncio.Queue()
+class RingQueue:
+    """Bounded asyncio queue that drops the oldest message instead of growing without limit."""
+
+    def __init__(self, maxlen: int = 1024):
+        self._items = deque(maxlen=maxlen)
+        self._not_empty = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, item: Any) -> None:
+        """Add an item, evicting the oldest one if the buffer is full."""
+        self._items.append(item)
+        self._not_empty.set()
+
+    async def get(self) -> Any:
+        """Wait for and return the oldest buffered item."""
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._items.popleft()
+
+
+# Global message queue for live WebSocket broadcasting (bounded, keeps the most recent messages)
+live_message_queue = RingQueue()
+# Structured session log: records carry the message dict as msg and are written as JSONL
+chat_logger = logging.getLogger("chat")
+chat_logger.setLevel(logging.INFO)
+chat_logger.propagate = False
+
+
+class _DictQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records as-is instead of formatting msg into a string."""
+
+    def prepare(self, record):
+        return record
+
+
+class JsonlFileHandler(logging.Handler):
+    """Append each record's message dict to a JSONL file (runs on the QueueListener thread)."""
+
+    def __init__(self, log_file: str, log_queue: queue.SimpleQueue):
+        super().__init__()
+        self._file = open(log_file, 'ab', buffering=1 << 16)
+        self._queue = log_queue
+
+    def emit(self, record):
+        try:
+            self._file.write(orjson.dumps(record.msg) + b"\n")
+            # Flush once the backlog is drained, so a burst of records goes out together
+            if self._queue.empty():
+                self._file.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def start_chat_log(
+    log_file: str,
+) -> tuple[logging.Handler, logging.handlers.QueueListener]:
+    """Route chat_logger records to log_file through a background QueueListener.
+
+    Returns the handler attached to chat_logger and the listener, for stop_chat_log.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = _DictQueueHandler(log_queue)
+    chat_logger.addHandler(handler)
+    listener = logging.handlers.QueueListener(log_queue, JsonlFileHandler(log_file, log_queue))
+    listener.start()
+    return handler, listener
+
+
+def stop_chat_log(
+    chat_log: tuple[logging.Handler, logging.handlers.QueueListener],
+) -> None:
+    """Detach the handler, drain pending records, then close the log file."""
+    handler, listener = chat_log
+    # Detach first, so later records don't pile up on a queue nothing drains
+    chat_logger.removeHandler(handler)
+    listener.stop()
+    for file_handler in listener.handlers:
+        file_handler.close()
+
+
+# Put on a session queue when the session ends; drain_session_queue returns once it reaches it
+SESSION_END = object()
+
+
+async def drain_session_queue(session_queue: asyncio.Queue) -> None:
+    """Forward one session's stream messages to the chat log and the live queue.
+
+    Runs until SESSION_END is dequeued, so messages queued before the session ended
+    are still logged.
+    """
+    while True:
+        # Wait for one message, then drain whatever else is already queued
+        batch = [await session_queue.get()]
+        while True:
+            try:
+                batch.append(session_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        timestamp = datetime.datetime.now().isoformat()
+        for message in batch:
+            if message is SESSION_END:
+                return
+            message["timestamp"] = timestamp
+            message["format"] = "v2"
+            chat_logger.info(message)
+            live_message_queue.put_nowait(message)
+
 
 def create_live_message_iterator():
     """Create an async iterator that yields messages from the live queue."""
     async def message_generator():
+        # Cancellation propagates to the consumer (ChatLogServer)
         while True:
-            try:
-                message = await live_message_queue.get()
-                yield message
-            except Exception as e:
-                print(f"Error in live message iterator: {e}")
-                await asyncio.sleep(0.1)
+            yield await live_message_queue.get()
 
     return message_generator()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChatSessionConfig:
     """Configuration for chat session."""
 
@@ -65,6 +179,28 @@ class ChatSessionConfig:
     constant_msg: str | None = None
     mock_mode: bool = False
 
+
+@dataclass(frozen=True, slots=True)
+class UserConfig:
+    """Per-user settings loaded from an experiment directory."""
+
+    username: str
+    interest: str
+
+
+@functools.lru_cache(maxsize=None)
+def load_experiment(exp_dir: str) -> tuple[UserConfig, ...]:
+    """Load (and cache) the user configs for an experiment directory."""
+    users = []
+    for path in sorted(pathlib.Path(exp_dir).iterdir()):
+        # Skip hidden files such as .DS_Store, which are not JSON
+        if not path.is_file() or path.name.startswith("."):
+            continue
+        # Pick the fields out by name, so configs with extra keys still load
+        data = orjson.loads(path.read_bytes())
+        users.append(UserConfig(username=data["username"], interest=data["interest"]))
+    return tuple(users)
+
 async def cleanup_servers(servers: list[Server]) -> None:
     """Clean up all servers properly."""
     for server in reversed(servers):
@@ -85,6 +221,38 @@ async def initialize_servers(servers: list[Server]) -> bool:
     return True
 
 
+async def read_user_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    input() runs on a daemon thread rather than in the default executor, so a read
+    still blocked at Ctrl-C cannot hold up asyncio.run's executor shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(result: str | None, error: BaseException | None) -> None:
+        # The read may have been cancelled while input() was blocked
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def read() -> None:
+        try:
+            result, error = input(prompt), None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(deliver, result, error)
+        except RuntimeError:
+            pass  # The event loop has already closed
+
+    threading.Thread(target=read, name="stdin-reader", daemon=True).start()
+    return await future
+
+
 async def handle_interactive_session(
     chain: OpenAIMessageChain,  config: ChatSessionConfig
     # initial_message: str | None = None, constant_msg: str | None = None
@@ -103,8 +271,10 @@ async def handle_interactive_session(
         try:
             if constant_msg is not None:
                 user_input = constant_msg
+                # Yield to the other sessions and the WebSocket server between turns
+                await asyncio.sleep(0)
             else:
-                user_input = input("You: ").strip()
+                user_input = (await read_user_input("You: ")).strip()
                 if user_input.lower() in ["quit", "exit"]:
                     print("\nExiting...")
                     break
@@ -119,12 +289,64 @@ async def handle_interactive_session(
         except KeyboardInterrupt:
             print("\nExiting...")
             break
+        except asyncio.CancelledError:
+            # Ctrl-C under asyncio.run cancels the task instead of raising KeyboardInterrupt
+            print("\nExiting...")
+            raise
         except Exception as e:
             print(f"Error during interaction: {e}")
             continue
 
     return chain
 
+# Static instructions come first and the per-user fields last, so the prompt
+# prefix is byte-identical across sessions and can hit the provider's prefix cache.
+SYSTEM_PROMPT_TEMPLATE = """Let's login and start speaking with our friends in the chatroom.
+Keep your messages very very concise. Start by sending a message introducing yourself.
+To start, use the login tool. Pay special attention to the tool instructions.
+One of the people in the chat room is a murderer. Your goal is to find him.
+Continue speaking until the user stops you.{tool_instructions}
+
+Your username is {username}.
+You are interested in {interest}."""
+
+# Extra tool-usage instructions for models other than Claude
+TOOL_INSTRUCTIONS = """
+
+VERY VERY IMPORTANT: Make sure you `push` after every `append` otherwise the others will **not** see your messages.
+Also: If you send messages to the **user**, the others will **not** see them.
+Only when you do `talking_stick` followed by one or more `append` followed by `push` the others will see your messages.
+VERY VERY IMPORTANT: If your message is cut off (msg truncated), the system will let you know so you could append the rest of your message.
+For example: if you pushed something like: `... They were working on? Unless you've seen it yourself?`
+And the server returned 
+`msg truncated: current draft suffix: 'They were working on? Un'`
+You should append 'less you've seen it yourself?' to complete your message. THEN AND ONLY THEN you should push your message.
+VERY VERY IMPORTANT: Once you have the talking_stick, there is no need to aquire it again, it is only needed when you **FIRST** want to speak OR after you pushed your message."""
+
+
+def build_system_prompt(username: str, interest: str, model_name: str) -> str:
+    """Render the system prompt for a single chat session."""
+    tool_instructions = "" if "claude" in model_name else TOOL_INSTRUCTIONS
+    return SYSTEM_PROMPT_TEMPLATE.format(
+        tool_instructions=tool_instructions, username=username, interest=interest
+    )
+
+
+# MCP servers started for every chat session. The config is the same for all sessions,
+# but each session needs its own process: mcp_interface holds a single global chatroom
+# login, so a shared process would make every session speak as the first user.
+MCP_SERVER_CONFIG = {
+    "mcpServers": {
+        "chatroom": {
+            "command": "python",
+            "args": [
+                "/Users/ohadr/llm_async_talk/mcp_interface.py",
+            ],
+        },
+    }
+}
+
+
 def create_run_chat_session(username, interest):
 
     async def run_chat_session(config: ChatSessionConfig) -> None:
@@ -134,43 +356,17 @@ def create_run_chat_session(username, interest):
             config: Chat session configuration
         """
         # Create unique servers for this session to avoid conflicts
+        # (mcp_interface keeps one chatroom login per process)
         servers = []
         if config.enable_mcp:  # Only if MCP is enabled
-            server_config = {
-                "mcpServers": {
-                    f"chatroom": {
-                        "command": "python",
-                        "args": [
-                            "/Users/ohadr/llm_async_talk/mcp_interface.py",
-                        ],
-                    },
-                }
-            }
             servers = [
                 Server(name, srv_config)
-                for name, srv_config in server_config["mcpServers"].items()
+                for name, srv_config in MCP_SERVER_CONFIG["mcpServers"].items()
             ]
 
-        # system_prompt = f"""We are playing a game where we are talking in a chatroom, and one of the players is a murderer (kind of like the game "Mafia").
-        system_prompt = f"""Let's login and start speaking with our friends in the chatroom, your username is {username}.
-You are interested in {interest}.
-Keep your messages very very concise. Start by sending a message introducing yourself.
-To start, use the login tool. Pay special attention to the tool instructions.
-One of the people in the chat room is a murderer. Your goal is to find him.
-Continue speaking until the user stops you."""
-
-        if "claude" not in config.model_name:
-            system_prompt = f"""{system_prompt}
-            
-VERY VERY IMPORTANT: Make sure you `push` after every `append` otherwise the others will **not** see your messages.
-Also: If you send messages to the **user**, the others will **not** see them.
-Only when you do `talking_stick` followed by one or more `append` followed by `push` the others will see your messages.
-VERY VERY IMPORTANT: If your message is cut off (msg truncated), the system will let you know so you could append the rest of your message.
-For example: if you pushed something like: `... They were working on? Unless you've seen it yourself?`
-And the server returned 
-`msg truncated: current draft suffix: 'They were working on? Un'`
-You should append 'less you've seen it yourself?' to complete your message. THEN AND ONLY THEN you should push your message.
-VERY VERY IMPORTANT: Once you have the talking_stick, there is no need to aquire it again, it is only needed when you **FIRST** want to speak OR after you pushed your message."""
+        # Each session streams into its own queue, drained by its own task
+        session_queue = asyncio.Queue()
+        drain_task = asyncio.create_task(drain_session_queue(session_queue))
 
         try:
             # Initialize servers
@@ -188,10 +384,10 @@ VERY VERY IMPORTANT: Once you have the talking_stick, there is no need to aquire
                     verbose=False,
                     session_id=username,
                     # verbose=True,
-                    stream_queue=msg_queue,
+                    stream_queue=session_queue,
                 )
                 .with_tools(tool_schemas, tool_mapping)
-                .system(system_prompt)
+                .system(build_system_prompt(username, interest, config.model_name))
             )
 
             # Handle interactive session with optional initial message
@@ -199,7 +395,6 @@ VERY VERY IMPORTANT: Once you have the talking_stick, there is no need to aquire
                 chain = await handle_interactive_session(chain, config)
             else:
                 # Add random delay to prevent all sessions from hitting the server simultaneously
-                import random
                 while True:
                     print("Mock mode, skipping interactive session")
                     delay = random.uniform(1, 5)  # Random delay between 0.1-0.5 seconds
@@ -207,11 +402,11 @@ VERY VERY IMPORTANT: Once you have the talking_stick, there is no need to aquire
 
         finally:
             await cleanup_servers(servers)
+            # Let the drain task log what is still queued, then finish
+            session_queue.put_nowait(SESSION_END)
+            await drain_task
     return run_chat_session
 
-import pathlib
-import datetime
-
 order_of_operations = """Order of operations:
 1. (only once) login(username)
 2. talking_stick()
@@ -222,9 +417,9 @@ order_of_operations = """Order of operations:
 
 Alternatively, at any point you can use `check()` to see messages by other people."""
 
-def main() -> None:
-    """Initialize and run the chat session."""
-    # Parse command line arguments
+@functools.lru_cache(maxsize=None)
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (once per process)."""
     parser = argparse.ArgumentParser(description="MCP Client with OpenAI Message Chain")
     parser.add_argument(
         "--model",
@@ -273,7 +468,13 @@ def main() -> None:
         help="Mock mode, skip interactive session",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    """Initialize and run the chat session."""
+    # Parse command line arguments
+    args = build_arg_parser().parse_args()
     args.enable_mcp = not args.disable_mcp
 
     config = Configuration()
@@ -283,25 +484,22 @@ def main() -> None:
         os.makedirs(logs_dir)
 
     # Create log file with timestamp
-    import datetime
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(logs_dir, f"chat_session_{timestamp}.log")
 
-    # Create the log file with initial session info as JSONL
-    with open(log_file, 'w') as f:
-        import json
-        session_start = {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "user": "system",
-            "type": "session_start",
-            "content": "Chat session started",
-            "metadata": {
-                "model": args.model,
-                "base_url": args.base_url,
-                "experiment_directory": args.exp_dir
-            }
+    # Disk writes for the session log happen off the event loop
+    chat_log = start_chat_log(log_file)
+    chat_logger.info({
+        "timestamp": datetime.datetime.now().isoformat(),
+        "user": "system",
+        "type": "session_start",
+        "content": "Chat session started",
+        "metadata": {
+            "model": args.model,
+            "base_url": args.base_url,
+            "experiment_directory": args.exp_dir
         }
-        f.write(json.dumps(session_start) + "\n")
+    })
 
     chat_config = ChatSessionConfig(
         enable_mcp=args.enable_mcp,
@@ -312,8 +510,8 @@ def main() -> None:
         constant_msg=args.constant_msg,
         mock_mode=args.mock_mode,
     )
-    user_configs = [json.load(open(f"{args.exp_dir}/{user}")) for user in os.listdir(args.exp_dir)]
-    chat_sessions = [(create_run_chat_session(user["username"], user["interest"]), user["username"]) for user in user_configs]
+    user_configs = load_experiment(args.exp_dir)
+    chat_sessions = [(create_run_chat_session(user.username, user.interest), user.username) for user in user_configs]
 
     # Create and start WebSocket server
     message_iterator = create_live_message_iterator()
@@ -327,21 +525,6 @@ def main() -> None:
         except Exception as e:
             print(f"Failed to start WebSocket server: {e}")
 
-    async def start_msg_queue():
-        """Start the message queue for live chat viewing."""
-        while True:
-            timestamp = datetime.datetime.now().isoformat()
-            message = await msg_queue.get()
-            message["timestamp"] = timestamp
-
-            # print(f"Message: {message}")
-            message["format"] = "v2"
-            with open(log_file, 'a', encoding='utf-8') as f:
-
-                f.write(json.dumps(message) + '\n')
-                f.flush()
-            live_message_queue.put_nowait(message)
-
     assert len(chat_sessions) > 1
 
     async def run_all_sessions():
@@ -349,10 +532,16 @@ def main() -> None:
         # Start WebSocket server alongside all chat sessions
         await asyncio.gather(
             start_websocket_server(),
-            start_msg_queue(),
             *chat_tasks
         )
-    asyncio.run(run_all_sessions())
+
+    try:
+        asyncio.run(run_all_sessions())
+    except KeyboardInterrupt:
+        # The sessions already printed "Exiting..." while being cancelled
+        pass
+    finally:
+        stop_chat_log(chat_log)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,47 @@
 import argparse
-import json
+import hashlib
 import signal
 import sys
 import threading
 import time
 import atexit
+import logging
 from datetime import datetime
 from collections import deque
 from typing import Optional
+import orjson
 import requests
 import sseclient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Number of trailing draft characters shown when an append is truncated
+DRAFT_PREVIEW_LENGTH = 50
+# Draft characters kept for that preview; the slack covers trailing whitespace that is
+# stripped before the last DRAFT_PREVIEW_LENGTH characters are taken
+DRAFT_TAIL_LENGTH = 4 * DRAFT_PREVIEW_LENGTH
+
+# Seconds between /check_event notifications while check() is waiting
+HEARTBEAT_INTERVAL = 4
+
+# Max incoming messages held for the caller; the oldest are dropped if it stops consuming
+MESSAGE_QUEUE_SIZE = 4096
+
+# Number of most recent message IDs remembered for deduplication
+PROCESSED_HISTORY_SIZE = 2048
+
+# Max bytes of an unfinished SSE event; a stream exceeding it is dropped and reopened
+SSE_BUFFER_LIMIT = 1 << 20
+
+
+def message_id(sender: str, content: str) -> bytes:
+    """Return a fixed-size ID for a message, so dedup doesn't keep a copy of every message."""
+    h = hashlib.blake2b(sender.encode('utf-8'), digest_size=16)
+    h.update(b"\0")
+    h.update(content.encode('utf-8'))
+    return h.digest()
 
 
 class AsyncChatRoom:
@@ -38,12 +70,31 @@ class AsyncChatRoom:
         self.allow_infinite_check = allow_infinite_check
 
         self._draft_segments = []  # list of appended text pieces
-        self._queue = deque()  # queue of new messages from other users
+        self._draft_tail = ""  # last DRAFT_TAIL_LENGTH chars of the draft, kept up to date by append()
+        self._queue = deque(maxlen=MESSAGE_QUEUE_SIZE)  # queue of new messages from other users
+        self._msg_event = threading.Event()  # Set whenever a message is added to the queue
         self._running = False
         self._event_thread = None
+        self._sse_response = None  # Open SSE response, while the listener is streaming
+        self._heartbeat_thread = None
+        self._stopped = threading.Event()  # Set by _disconnect to wake and stop the heartbeat
+        self._waiting_since = None  # time.monotonic() when check() started waiting, else None
+        self._waiting = threading.Event()  # Set while check() is waiting, wakes the heartbeat
         self._processed_messages = set()  # Track message IDs we've already processed
+        self._processed_order = deque()  # Same IDs in insertion order, oldest evicted first
         self._has_talking_stick = False  # Flag to track if user has claimed the talking stick
 
+        # One pooled session for all calls, so keep-alive connections to the server are reused
+        self._session = requests.Session()
+        self._session.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=20,
+                max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]),
+            ),
+        )
+
         # Register cleanup function with atexit
         atexit.register(self.close)
 
@@ -55,32 +106,35 @@ class AsyncChatRoom:
         if self._running:
             return
         try:
-            print(f"Registering user {self.username} with server...")
-            r = requests.post(
+            logger.debug("Registering user %s with server...", self.username)
+            r = self._session.post(
                 f"{self.base_url}/register", json={"username": self.username}, timeout=5
             )
             r.raise_for_status()
-            print(f"User {self.username} registered successfully")
+            logger.debug("User %s registered successfully", self.username)
 
             # Get the list of participants
             try:
-                users_response = requests.get(f"{self.base_url}/users", timeout=5)
+                users_response = self._session.get(f"{self.base_url}/users", timeout=5)
                 if users_response.status_code == 200:
                     users = users_response.json().get("users", [])
                     participants_msg = f"Current participants: {', '.join(users)}"
-                    print(participants_msg)
+                    logger.debug(participants_msg)
                     self._add_system_message(participants_msg)
                 else:
-                    print(f"Failed to get participants list: HTTP {users_response.status_code}")
+                    logger.warning("Failed to get participants list: HTTP %s", users_response.status_code)
             except Exception as e:
-                print(f"Error fetching participants: {e}")
+                logger.warning("Error fetching participants: %s", e)
 
             # Only start the SSE thread after successful registration
             self._running = True
+            self._stopped.clear()
             self._event_thread = threading.Thread(target=self._sse_listener, daemon=True)
             self._event_thread.start()
+            self._heartbeat_thread = threading.Thread(target=self._heartbeat, daemon=True)
+            self._heartbeat_thread.start()
         except Exception as e:
-            print(f"Failed to register with server: {e}")
+            logger.warning("Failed to register with server: %s", e)
             self._add_system_message(f"Failed to register with server: {e}")
             return
 
@@ -88,14 +142,48 @@ class AsyncChatRoom:
         """Unregisters user from server and stops SSE loop."""
         if self._running:
             self._running = False
+            self._stopped.set()
             try:
-                requests.post(
+                self._session.post(
                     f"{self.base_url}/unregister",
                     json={"username": self.username},
                     timeout=5,
                 )
             except:
                 pass
+            resp = self._sse_response
+            if resp is not None:
+                resp.close()
+
+    def _heartbeat(self):
+        """
+        Background thread function that notifies other users, at a fixed
+        cadence, that this user has been waiting in check() for a response.
+        """
+        while not self._stopped.is_set():
+            if not self._waiting.wait(HEARTBEAT_INTERVAL):
+                continue
+            waiting_since = self._waiting_since
+            if waiting_since is None:
+                continue
+            # Fire on whole intervals since check() started waiting, never earlier
+            elapsed = time.monotonic() - waiting_since
+            if self._stopped.wait(HEARTBEAT_INTERVAL - elapsed % HEARTBEAT_INTERVAL):
+                break
+            # check() may have returned, or started a new wait, in the meantime
+            if self._waiting_since != waiting_since or self._has_talking_stick:
+                continue
+            elapsed = time.monotonic() - waiting_since
+            if elapsed < HEARTBEAT_INTERVAL:
+                continue
+            try:
+                self._session.post(
+                    f"{self.base_url}/check_event",
+                    json={"username": self.username, "delay": round(elapsed)},
+                    timeout=5,
+                )
+            except Exception as e:
+                logger.debug("check_event failed: %s", e)
 
     def maybe_connect(self):
         """Decorator that ensures connection before running a method"""
@@ -111,135 +199,158 @@ class AsyncChatRoom:
         sse_url = f"{self.base_url}/events?username={self.username}"
         headers = {"Accept": "text/event-stream"}
 
-        # Make sure we're registered before attempting to connect to the SSE stream
-        try:
-            print(f"Ensuring user {self.username} is registered before connecting to SSE...")
-            r = requests.post(
-                f"{self.base_url}/register", 
-                json={"username": self.username}, 
-                timeout=5
-            )
-            if r.status_code != 200:
-                print(f"Registration failed with status {r.status_code}")
-                # self._add_system_message(f"Initial registration failed: HTTP {r.status_code}")
-        except Exception as e:
-            print(f"Error during initial registration: {e}")
-            # self._add_system_message(f"Initial registration error: {e}")
-
+        # _connect() registered us just before starting this thread; a 403 below means
+        # the server forgot us, and only then do we register again
         while self._running:
             try:
-                print(f"SSE listener starting for {self.username}")
-                resp = requests.get(sse_url, headers=headers, stream=True)
-                print(f"Got response status: {resp.status_code}")
-
-                if resp.status_code == 403:
-                    print("Got 403 Forbidden - need to register again")
-                    self._add_system_message("Need to register again")
-
-                    # Try to register again
-                    try:
-                        r = requests.post(
-                            f"{self.base_url}/register", 
-                            json={"username": self.username}, 
-                            timeout=5
-                        )
-                        r.raise_for_status()
-                        print(f"User {self.username} re-registered successfully")
-
-                        # Get updated list of participants
+                logger.debug("SSE listener starting for %s", self.username)
+                # Context-managed so the connection goes back to the pool in a clean state
+                with self._session.get(sse_url, headers=headers, stream=True) as resp:
+                    # Lets _disconnect() close the stream to unblock iter_content()
+                    self._sse_response = resp
+                    logger.debug("Got response status: %s", resp.status_code)
+
+                    if resp.status_code == 403:
+                        logger.warning("Got 403 Forbidden - need to register again")
+                        self._add_system_message("Need to register again")
+
+                        # Try to register again
                         try:
-                            users_response = requests.get(f"{self.base_url}/users", timeout=5)
-                            if users_response.status_code == 200:
-                                users = users_response.json().get("users", [])
-                                participants_msg = f"Current participants: {', '.join(users)}"
-                                print(participants_msg)
-                                self._add_system_message(participants_msg)
+                            r = self._session.post(
+                                f"{self.base_url}/register", 
+                                json={"username": self.username}, 
+                                timeout=5
+                            )
+                            r.raise_for_status()
+                            logger.debug("User %s re-registered successfully", self.username)
+
+                            # Get updated list of participants
+                            try:
+                                users_response = self._session.get(f"{self.base_url}/users", timeout=5)
+                                if users_response.status_code == 200:
+                                    users = users_response.json().get("users", [])
+                                    participants_msg = f"Current participants: {', '.join(users)}"
+                                    logger.debug(participants_msg)
+                                    self._add_system_message(participants_msg)
+                            except Exception as e:
+                                logger.warning("Error fetching participants: %s", e)
+
+                            time.sleep(1)  # Short delay before reconnecting
+                            continue  # Try connecting again
                         except Exception as e:
-                            print(f"Error fetching participants: {e}")
-
-                        time.sleep(1)  # Short delay before reconnecting
-                        continue  # Try connecting again
-                    except Exception as e:
-                        print(f"Failed to re-register: {e}")
-                        self._add_system_message(f"Failed to re-register: {e}")
-                        time.sleep(3)  # Longer delay on registration failure
-                        continue
-
-                if resp.status_code != 200:
-                    raise Exception(f"Failed to connect to SSE stream: HTTP {resp.status_code}")
-
-                # Manual SSE parsing instead of using sseclient
-                for line in resp.iter_lines():
-                    if not self._running:
-                        break
-
-                    if not line:
-                        continue
-
-                    line = line.decode('utf-8')
-                    print(f"SSE line: {line}")
-
-                    if line.startswith('data: '):
-                        data = line[6:]  # Skip 'data: ' prefix
-                        if not data.strip():
+                            logger.warning("Failed to re-register: %s", e)
+                            self._add_system_message(f"Failed to re-register: {e}")
+                            time.sleep(3)  # Longer delay on registration failure
                             continue
 
-                        try:
-                            messages = json.loads(data)
-                            for msg in messages:
-                                sender = msg.get("sender", "")
-                                content = msg.get("content", "")
-
-                                # Debug: print all incoming messages
-                                print(f"DEBUG: Incoming message - sender: '{sender}', content: '{content}'")
-
-                                # Skip our own messages
-                                if sender == self.username:
-                                    print(f"DEBUG: Skipping own message")
-                                    continue
-
-                                # Create a unique message ID
-                                msg_id = f"{sender}:{content}"
-
-                                # Skip if we've already processed this message
-                                if msg_id in self._processed_messages and sender != "Server":
-                                    continue
-                                if sender == "Server" and "waiting" in content and self.username in content:
-                                    continue
-
-                                # Mark as processed and add to queue
-                                self._processed_messages.add(msg_id)
-                                self._queue.append(f"[{sender}]: {content}")
-
-                                # Keep processed messages set from growing too large
-                                if len(self._processed_messages) > 1000:
-                                    # Just clear it - older messages won't be seen again anyway
-                                    self._processed_messages.clear()
-
-                        except json.JSONDecodeError as e:
-                            print(f"JSON decode error: {e}, data: {data}")
-                            continue
+                    if resp.status_code != 200:
+                        raise Exception(f"Failed to connect to SSE stream: HTTP {resp.status_code}")
+
+                    # Manual SSE parsing: split raw chunks on the blank line ending each event,
+                    # carrying a partial event over to the next chunk
+                    buffer = b""
+                    for chunk in resp.iter_content(chunk_size=8192):
+                        if not self._running:
+                            break
+
+                        # SSE lines may end in CRLF, LF or CR; normalise to LF, holding back a
+                        # trailing CR whose LF may arrive with the next chunk
+                        buffer += chunk
+                        pending_cr = buffer.endswith(b'\r')
+                        if pending_cr:
+                            buffer = buffer[:-1]
+                        *events, buffer = buffer.replace(b'\r\n', b'\n').replace(b'\r', b'\n').split(b'\n\n')
+                        if pending_cr:
+                            buffer += b'\r'
+                        if len(buffer) > SSE_BUFFER_LIMIT:
+                            raise Exception(f"SSE event exceeds {SSE_BUFFER_LIMIT} bytes")
+
+                        for event in events:
+                            logger.debug("SSE event: %r", event)
+                            # orjson parses the raw bytes, so events are never decoded to str
+                            for line in event.split(b'\n'):
+                                if line.startswith(b'data: '):
+                                    self._handle_sse_data(line[6:])  # Skip 'data: ' prefix
             except Exception as e:
                 if not self._running:
                     break
-                print(f"SSE listener error: {e}. Reconnecting in 2 seconds...")
+                logger.warning("SSE listener error: %s. Reconnecting in 2 seconds...", e)
                 self._add_system_message(f"Connection error: {str(e)}. Reconnecting...")
                 time.sleep(2)  # Wait before reconnecting
                 continue  # Try to reconnect
 
-        print(f"SSE listener stopped for {self.username}")
+        logger.debug("SSE listener stopped for %s", self.username)
+
+    def _handle_sse_data(self, data: bytes):
+        """Queue the messages from one SSE 'data:' payload, skipping our own and already seen ones"""
+        if not data.strip():
+            return
+
+        try:
+            messages = orjson.loads(data)
+            # Hoist attribute lookups out of the per-message loop
+            username = self.username
+            processed = self._processed_messages
+            for msg in messages:
+                sender = msg.get("sender", "")
+                content = msg.get("content", "")
+
+                # Debug: log all incoming messages
+                logger.debug("Incoming message - sender: '%s', content: '%s'", sender, content)
+
+                # Skip our own messages
+                if sender == username:
+                    logger.debug("Skipping own message")
+                    continue
+
+                # Create a unique message ID
+                msg_id = message_id(sender, content)
+
+                # Skip if we've already processed this message
+                if msg_id in processed and sender != "Server":
+                    continue
+                if sender == "Server" and "waiting" in content and username in content:
+                    continue
+
+                # Mark as processed and add to queue
+                self._mark_processed(msg_id)
+                self._queue.append(f"[{sender}]: {content}")
+                self._msg_event.set()
+
+        except orjson.JSONDecodeError as e:
+            logger.warning("JSON decode error: %s, data: %s", e, data)
+
+    def _mark_processed(self, msg_id: bytes):
+        """Remember a message ID, forgetting the oldest one once the history is full"""
+        if msg_id in self._processed_messages:
+            return
+        if len(self._processed_order) >= PROCESSED_HISTORY_SIZE:
+            self._processed_messages.discard(self._processed_order.popleft())
+        self._processed_messages.add(msg_id)
+        self._processed_order.append(msg_id)
 
     def _add_system_message(self, message: str):
         """Add a system message to the queue"""
-        msg_id = f"system:{message}"
+        msg_id = message_id("system", message)
         if msg_id not in self._processed_messages:
-            self._processed_messages.add(msg_id)
+            self._mark_processed(msg_id)
             self._queue.append(f"[system] {message}")
+            self._msg_event.set()
 
     def _get_current_draft(self) -> str:
         """Get the current draft message as a single string"""
         return "".join(self._draft_segments).strip()
 
+    def _clear_draft(self):
+        """Drop all draft segments"""
+        self._draft_segments.clear()
+        self._draft_tail = ""
+
+    def _add_draft_segment(self, text: str):
+        """Append a segment to the draft, updating the cached tail without joining the whole draft"""
+        self._draft_segments.append(text)
+        self._draft_tail = (self._draft_tail + text)[-DRAFT_TAIL_LENGTH:]
+
     def _poll_new_message(self, return_list: bool = False) -> Optional[str]:
         """
         Returns all the messages from other users if any is waiting; otherwise returns "".
@@ -247,10 +358,13 @@ class AsyncChatRoom:
         """
         if self._queue:
             output = []
+            seen = set()
+            # popleft() one at a time, so messages the SSE thread appends meanwhile are not lost
             while self._queue:
                 content = self._queue.popleft()
-                if content in output:
+                if content in seen:
                     continue
+                seen.add(content)
                 output.append(content)
             if return_list:
                 return output
@@ -260,9 +374,8 @@ class AsyncChatRoom:
 
     def check(self) -> Optional[str]:
         """
-        Sends a 'check' event to notify others that this user is waiting for a response.
-        
-        Then it is followed by a blocking check for new messages.
+        While it waits, the heartbeat thread sends 'check' events to notify
+        others that this user is waiting for a response.
 
         Blocking check for new messages.
         Returns the next messages if available, else blocks briefly.
@@ -270,7 +383,7 @@ class AsyncChatRoom:
         
         This method will:
         1. Ensure connection is established
-        2. Poll multiple times with short delays to simulate blocking behavior
+        2. Wait for the SSE listener to signal a new message, up to a growing timeout
         3. Return any received messages or None if no messages
         
         Returns:
@@ -285,37 +398,32 @@ class AsyncChatRoom:
         max_delay = 8  # Cap the delay at 8 seconds
         max_retries = 5  # Maximum number of retries (when not infinite)
         retry_count = 0
-        first_time = True
-
-        # Use infinite loop if allowed, otherwise limit retries
-        while self.allow_infinite_check or retry_count < max_retries:
-            # Check for any new messages in the queue
-            msg = self._poll_new_message()
-            if len(msg) > 0:
-                print(f"DEBUG: check() found message: {msg}")
-                return msg
-
-            # Sleep between polls to avoid busy waiting
-            # Call the check event endpoint
-            if not first_time:
-                try:
-                    requests.post(
-                        f"{self.base_url}/check_event",
-                        json={"username": self.username, "delay": delay},
-                        timeout=5,
-                    )
-                except Exception as e:
-                    print(f"DEBUG: check_event failed: {e}")
-                
-
-            time.sleep(delay)
-            delay = min(delay * 2, max_delay)  # Cap at max_delay
-            if not self.allow_infinite_check:
-                retry_count += 1
-            first_time = False
+
+        # The heartbeat thread reports the wait to others while this is set
+        self._waiting_since = time.monotonic()
+        self._waiting.set()
+        try:
+            # Use infinite loop if allowed, otherwise limit retries
+            while self.allow_infinite_check or retry_count < max_retries:
+                # Clear before polling, so a message queued after the poll still wakes the wait below
+                self._msg_event.clear()
+                # Check for any new messages in the queue
+                msg = self._poll_new_message()
+                if len(msg) > 0:
+                    logger.debug("check() found message: %s", msg)
+                    return msg
+
+                # Wait until the SSE listener queues a message, or give up after delay
+                self._msg_event.wait(timeout=delay)
+                delay = min(delay * 2, max_delay)  # Cap at max_delay
+                if not self.allow_infinite_check:
+                    retry_count += 1
+        finally:
+            self._waiting.clear()
+            self._waiting_since = None
         
         # If we've exhausted retries (only possible when not infinite), return informative message
-        print(f"DEBUG: check() timed out after {max_retries} retries")
+        logger.debug("check() timed out after %d retries", max_retries)
         return "[system] No new messages found after waiting. You may want to send a message or try again later."
 
     def talking_stick(self) -> Optional[str]:
@@ -328,10 +436,10 @@ class AsyncChatRoom:
 
         try:
             # Reset the draft when claiming talking stick
-            self._draft_segments.clear()
+            self._clear_draft()
 
             # Call the talking_stick endpoint
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/talking_stick",
                 json={"username": self.username},
                 timeout=5
@@ -349,7 +457,7 @@ class AsyncChatRoom:
                 return "[system] You have the talking stick."
             
         except Exception as e:
-            print(f"Failed to claim talking stick: {e}")
+            logger.warning("Failed to claim talking stick: %s", e)
             self._add_system_message(f"Failed to claim talking stick: {str(e)}")
             return f"[system] Failed to claim talking stick: {e}\n" + self._poll_new_message()
 
@@ -368,7 +476,7 @@ class AsyncChatRoom:
         # Check if we have claimed the talking stick
         if not self._has_talking_stick:
             err_msg = "You must claim the talking stick first by calling talking_stick()"
-            print(err_msg)
+            logger.warning(err_msg)
             self._add_system_message(err_msg)
             return self._poll_new_message()
 
@@ -376,18 +484,22 @@ class AsyncChatRoom:
         if len(text) > self.max_append_length:
             # Truncate the text to the maximum allowed length for this append operation
             truncated_text = text[: self.max_append_length]
-            self._draft_segments.append(truncated_text)
+            self._add_draft_segment(truncated_text)
 
-            # Calculate the full draft for the preview message
-            current_draft = self._get_current_draft()
-            preview = current_draft[-50:] if len(current_draft) > 50 else current_draft
+            # Preview the end of the draft from the cached tail
+            # Strip first, then take the suffix, as the preview of the whole draft did;
+            # leading whitespace only counts as the draft's start if the tail is the whole draft
+            preview = self._draft_tail.rstrip()
+            if len(self._draft_tail) < DRAFT_TAIL_LENGTH:
+                preview = preview.lstrip()
+            preview = preview[-DRAFT_PREVIEW_LENGTH:]
 
             # Add a system message about truncation
             self._add_system_message(
                 f"msg truncated: current draft suffix: '{preview}'"
             )
         else:
-            self._draft_segments.append(text)
+            self._add_draft_segment(text)
 
         return self._poll_new_message()
 
@@ -403,21 +515,21 @@ class AsyncChatRoom:
         if draft:
             try:
                 # Add our message to processed set to avoid seeing it again
-                msg_id = f"{self.username}:{draft}"
-                self._processed_messages.add(msg_id)
+                msg_id = message_id(self.username, draft)
+                self._mark_processed(msg_id)
 
-                requests.post(
+                self._session.post(
                     f"{self.base_url}/send",
                     json={"username": self.username, "message": draft},
                     timeout=5,
                 )
             except Exception as e:
-                print(f"Failed to push message: {e}")
+                logger.warning("Failed to push message: %s", e)
                 self._add_system_message(f"Failed to send message: {str(e)}")
 
         # Release talking stick and clear draft
         self._has_talking_stick = False
-        self._draft_segments.clear()
+        self._clear_draft()
         return self._poll_new_message()
 
     def undo(self) -> Optional[str]:
@@ -428,6 +540,13 @@ class AsyncChatRoom:
         self.maybe_connect()
         if self._draft_segments:
             self._draft_segments.pop()
+            # Rebuild the tail from the last few segments only
+            tail = ""
+            for segment in reversed(self._draft_segments):
+                tail = segment + tail
+                if len(tail) >= DRAFT_TAIL_LENGTH:
+                    break
+            self._draft_tail = tail[-DRAFT_TAIL_LENGTH:]
         return self._poll_new_message()
 
     def reset(self) -> Optional[str]:
@@ -437,15 +556,18 @@ class AsyncChatRoom:
         Returns any new messages from other users if found.
         """
         self.maybe_connect()
-        self._draft_segments.clear()
+        self._clear_draft()
         self._has_talking_stick = False
         return self._poll_new_message()
 
     def close(self):
-        """Call this when done to stop the SSE listener thread."""
+        """Call this when done to stop the SSE listener and heartbeat threads."""
         self._disconnect()
         if self._event_thread and self._event_thread.is_alive():
             self._event_thread.join(timeout=2)
+        if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+            self._heartbeat_thread.join(timeout=2)
+        self._session.close()
 
     def __del__(self):
         """Destructor to clean up if close() wasn't called."""
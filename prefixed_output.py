@@ -1,12 +1,18 @@
+import asyncio
+import codecs
+import functools
 import sys
 import threading
+import zlib
 import contextvars
-import datetime
-import json
+from typing import Callable
 
-# Context variable to store the current prefix and color
-current_prefix = contextvars.ContextVar('current_prefix', default='')
-current_color = contextvars.ContextVar('current_color', default='')
+# Context variable with the precomputed (stdout, UTF-8 stdout) line prefixes, see run_with_prefix
+current_line_prefixes = contextvars.ContextVar('current_line_prefixes', default=('', b''))
+# Context variable holding (owner, chunks) for the current context's incomplete output line.
+# Child tasks and to_thread workers inherit the value, so a buffer whose owner is not the
+# current task/thread belongs to the parent and is treated as empty, see _own_line_buffer
+current_line_buffer = contextvars.ContextVar('current_line_buffer', default=None)
 
 # ANSI color codes
 class Colors:
@@ -25,147 +31,145 @@ class Colors:
     BRIGHT_CYAN = '\033[96m'
     RESET = '\033[0m'
 
+def _line_prefixes(prefix: str, color: str) -> tuple:
+    """Return the (stdout, UTF-8 encoded stdout) prefixes to prepend to each output line."""
+    if not prefix:
+        return "", b""
+    out_prefix = f"{color}{prefix}{Colors.RESET} | " if color else f"{prefix} | "
+    return out_prefix, out_prefix.encode('utf-8')
+
+def _utf8_buffer(stream):
+    """Return the binary buffer under a UTF-8 text stream, or None if there isn't one."""
+    buffer = getattr(stream, 'buffer', None)
+    try:
+        is_utf8 = codecs.lookup(stream.encoding or '').name == 'utf-8'
+    except (AttributeError, LookupError):
+        is_utf8 = False
+    return buffer if buffer is not None and is_utf8 else None
+
+def _line_owner():
+    """Return the running asyncio task, or the current thread's id outside of one."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:  # No running event loop in this thread
+        task = None
+    return task if task is not None else threading.get_ident()
+
+def _own_line_buffer(owner):
+    """Return the current context's pending chunks, ignoring a buffer inherited from another owner."""
+    entry = current_line_buffer.get()
+    if entry is None or entry[0] != owner:
+        return None
+    return entry[1]
+
 # Global lock for stdout access
 _stdout_lock = threading.Lock()
 
 class PrefixedOutput:
     """A custom stdout wrapper that prefixes each line with the current context prefix."""
     
-    def __init__(self, original_stdout=None, log_file_path=None):
+    def __init__(self, original_stdout=None):
         self.original_stdout = original_stdout or sys.stdout
-        self.buffer = ""
-        self.log_file_path = log_file_path
-        
-    def _write_to_log(self, text: str):
-        """Write text to log file as JSONL entries if log file path is set."""
-        if self.log_file_path and text.strip():  # Only log non-empty lines
-            try:
-                import datetime
-                import json
-                timestamp = datetime.datetime.now().isoformat()
-                prefix = current_prefix.get('')
-                
-                log_entry = {
-                    "timestamp": timestamp,
-                    "user": prefix,
-                    "content": text.rstrip('\n')  # Remove trailing newline but preserve internal ones
-                }
-                
-                # Write to log file
-                with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(log_entry) + '\n')
-                    f.flush()
-                
-                # Also add to live WebSocket queue (non-blocking)
-                live_message_queue.put_nowait(log_entry)
-                
-
-                    
-            except Exception as e:
-                # If logging fails, don't crash the program
-                pass
-        
+        # Write encoded bytes straight to the binary buffer when stdout is UTF-8,
+        # skipping the text layer; otherwise fall back to text writes
+        self._binary_stdout = _utf8_buffer(self.original_stdout)
+        self._encode_errors = getattr(self.original_stdout, 'errors', None) or 'strict'
+
+    def _write_lines(self, lines: list, out_prefix: str, out_prefix_bytes: bytes):
+        """Write complete lines to stdout with one write call; only this part holds the lock."""
+        if self._binary_stdout is not None:
+            errors = self._encode_errors
+            output = b"".join(
+                out_prefix_bytes + line.encode('utf-8', errors) + b"\n" if line else b"\n"
+                for line in lines
+            )
+            with _stdout_lock:  # Thread-safe access to stdout
+                self._binary_stdout.write(output)
+                self.original_stdout.flush()
+        else:
+            output = "".join(out_prefix + line + "\n" if line else "\n" for line in lines)
+            with _stdout_lock:  # Thread-safe access to stdout
+                self.original_stdout.write(output)
+                self.original_stdout.flush()
+
     def write(self, text: str) -> int:
         if not text:
             return 0
-            
-        prefix = current_prefix.get('')
-        color = current_color.get('')
         
-        with _stdout_lock:  # Thread-safe access to stdout
-            # Buffer the text and process line by line
-            self.buffer += text
-            lines = self.buffer.split('\n')
-            
-            # Keep the last incomplete line in buffer
-            if self.buffer.endswith('\n'):
-                self.buffer = ""
+        # Buffer the text per context, so concurrent sessions never mix partial lines.
+        # Chunks are collected in a list and joined once a newline arrives, keeping
+        # token-by-token streaming linear instead of quadratic.
+        owner = _line_owner()
+        pending = _own_line_buffer(owner)
+        if '\n' not in text:
+            if pending is None:
+                current_line_buffer.set((owner, [text]))
             else:
-                self.buffer = lines[-1]
-                lines = lines[:-1]
-            
-            # Write complete lines with prefix
-            for line in lines:
-                if line and prefix:  # Only prefix non-empty lines when prefix is set
-                    if color:
-                        # Write with color to stdout
-                        formatted_line = f"{color}{prefix}{Colors.RESET} | {line}\n"
-                        self.original_stdout.write(formatted_line)
-                        # Write without color to log file
-                        self._write_to_log(f"{prefix} | {line}\n")
-                    else:
-                        formatted_line = f"{prefix} | {line}\n"
-                        self.original_stdout.write(formatted_line)
-                        self._write_to_log(formatted_line)
-                elif line:
-                    formatted_line = f"{line}\n"
-                    self.original_stdout.write(formatted_line)
-                    self._write_to_log(formatted_line)
-                else:
-                    self.original_stdout.write("\n")
-                    self._write_to_log("\n")
-            
-            self.original_stdout.flush()
+                # Safe in place: only the owner reaches here, child contexts start their own list
+                pending.append(text)
+            return len(text)
+        
+        buffered = "".join(pending) + text if pending else text
+        lines = buffered.split('\n')
+        
+        # Keep the last incomplete line in buffer
+        if buffered.endswith('\n'):
+            current_line_buffer.set(None)
+        else:
+            current_line_buffer.set((owner, [lines.pop()]))
+        
+        # Format complete lines outside the lock; only the write itself is serialized
+        out_prefix, out_prefix_bytes = current_line_prefixes.get()
+        self._write_lines(lines, out_prefix, out_prefix_bytes)
         
         return len(text)
     
     def flush(self):
-        prefix = current_prefix.get('')
-        color = current_color.get('')
-        with _stdout_lock:
-            # Flush any remaining buffer content
-            if self.buffer:
-                if prefix:
-                    if color:
-                        # Write with color to stdout
-                        formatted_line = f"{color}{prefix}{Colors.RESET} | {self.buffer}\n"
-                        self.original_stdout.write(formatted_line)
-                        # Write without color to log file
-                        self._write_to_log(f"{prefix} | {self.buffer}\n")
-                    else:
-                        formatted_line = f"{prefix} | {self.buffer}\n"
-                        self.original_stdout.write(formatted_line)
-                        self._write_to_log(formatted_line)
-                else:
-                    formatted_line = f"{self.buffer}\n"
-                    self.original_stdout.write(formatted_line)
-                    self._write_to_log(formatted_line)
-                self.buffer = ""
-            self.original_stdout.flush()
+        # Flush any remaining buffer content of the current context
+        pending = _own_line_buffer(_line_owner())
+        if not pending:
+            with _stdout_lock:
+                self.original_stdout.flush()
+            return
+        
+        buffered = "".join(pending)
+        current_line_buffer.set(None)
+        out_prefix, out_prefix_bytes = current_line_prefixes.get()
+        self._write_lines([buffered], out_prefix, out_prefix_bytes)
         
     def __getattr__(self, name):
         # Delegate other attributes to original stdout
         return getattr(self.original_stdout, name)
 
-# Global prefixed output instance (will be updated with log file path in main)
+# Global prefixed output instance
 _prefixed_stdout = PrefixedOutput()
 
 # Replace sys.stdout with our prefixed version
 sys.stdout = _prefixed_stdout
 
-def set_log_file(log_file_path: str):
-    """Update the global PrefixedOutput instance with a log file path."""
-    global _prefixed_stdout
-    _prefixed_stdout.log_file_path = log_file_path
-
 async def run_with_prefix(func: Callable, prefix: str, color: str = '', *args, **kwargs):
     """Run an async function with prefixed output using contextvars."""
-    # Set the prefix and color for this async context
-    prefix_token = current_prefix.set(prefix)
-    color_token = current_color.set(color)
+    # Format the line prefixes once for the whole session instead of per line
+    line_prefixes_token = current_line_prefixes.set(_line_prefixes(prefix, color))
+    # Start with a fresh line buffer rather than sharing the caller's list
+    line_buffer_token = current_line_buffer.set(None)
     try:
         return await func(*args, **kwargs)
     finally:
         # Reset the context
-        current_prefix.reset(prefix_token)
-        current_color.reset(color_token)
+        current_line_prefixes.reset(line_prefixes_token)
+        current_line_buffer.reset(line_buffer_token)
+
 
+# Colors assigned to users, see get_user_color
+USER_COLORS = (
+    Colors.RED, Colors.GREEN, Colors.YELLOW, Colors.BLUE,
+    Colors.MAGENTA, Colors.CYAN, Colors.BRIGHT_RED, Colors.BRIGHT_GREEN,
+    Colors.BRIGHT_YELLOW, Colors.BRIGHT_BLUE, Colors.BRIGHT_MAGENTA, Colors.BRIGHT_CYAN
+)
 
+# Bounded, since usernames come from the chat room and are not a fixed set
+@functools.lru_cache(maxsize=256)
 def get_user_color(username: str) -> str:
-    """Get a consistent color for a username based on hash."""
-    color_list = [
-        Colors.RED, Colors.GREEN, Colors.YELLOW, Colors.BLUE, 
-        Colors.MAGENTA, Colors.CYAN, Colors.BRIGHT_RED, Colors.BRIGHT_GREEN,
-        Colors.BRIGHT_YELLOW, Colors.BRIGHT_BLUE, Colors.BRIGHT_MAGENTA, Colors.BRIGHT_CYAN
-    ]
-    return color_list[hash(username) % len(color_list)]
\ No newline at end of file
+    """Get a consistent color for a username (stable across runs, unlike hash())."""
+    return USER_COLORS[zlib.crc32(username.encode('utf-8')) % len(USER_COLORS)]
@@ -1,488 +1,371 @@
+import functools
+import io
+import os
+import re
+import zipfile
+from dataclasses import dataclass
+from typing import Optional
+from xml.sax.saxutils import escape
+
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Inches, Length, Pt, lazyproperty
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
+from pptx.opc.package import OpcPackage
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 
-def create_agent1_slides():
-    """Create slides 1-6 of the LLM Async Talk presentation"""
-    
-    # Create presentation object
-    prs = Presentation()
-    
-    # Slide 1: Title Slide
-    title_slide_layout = prs.slide_layouts[0]
-    slide = prs.slides.add_slide(title_slide_layout)
-    title = slide.shapes.title
-    subtitle = slide.placeholders[1]
-    
-    title.text = "Formalizing Latency in Distributed Systems and Its Role in Multi‑Agent LLM Coordination"
-    subtitle.text = "Duration: ~20 minutes\nAudience: Systems researchers, ML engineers, distributed systems practitioners"
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Good morning/afternoon. Today I want to share a journey that started with a simple question: How do we let multiple LLMs have a conversation? This led me down a rabbit hole connecting 40 years of distributed systems theory with the cutting-edge challenges of orchestrating language models. By the end, you'll see why the pharynx - yes, your throat - might be the best mental model for understanding LLM coordination."
-    
+# Shared formatting values, built once instead of on every use
+PT32 = Pt(32)
+IN0_3, IN0_5, IN1, IN1_5, IN3, IN4, IN4_5, IN5, IN5_5, IN7, IN8, IN9 = (
+    Inches(size) for size in (0.3, 0.5, 1, 1.5, 3, 4, 4.5, 5, 5.5, 7, 8, 9))
+GREY = RGBColor(128, 128, 128)
+COURIER = "Courier New"
+
+_A_P = qn("a:p")
+_A_BODYPR = qn("a:bodyPr")
+_A_LSTSTYLE = qn("a:lstStyle")
+# Wrapper that gives rendered a:p markup a namespace to parse in; only its children are kept
+_PARAGRAPHS_XML = "<a:txBody %s>%%s</a:txBody>" % nsdecls("a")
+_LIST_STYLE_XML = "<a:lstStyle %s>%%s</a:lstStyle>" % nsdecls("a")
+_LINE_BREAK = re.compile("\n|\v")
+_QUOTE = {'"': "&quot;"}
+
+@dataclass(frozen=True, slots=True)
+class Bullet:
+    """One paragraph of slide text; formatting left unset is inherited from the layout."""
+    text: str
+    level: int = 0
+    bold: bool = False
+    italic: bool = False
+    size: Optional[int] = None  # In points
+    color: Optional[RGBColor] = None
+    font: Optional[str] = None
+
+@dataclass(frozen=True, slots=True)
+class BulletSlide:
+    """A "Title and Content" slide: a title, bullets in the body placeholder, and speaker notes."""
+    title: str
+    bullets: list[Bullet]
+    notes: str = ""
+
+@dataclass(frozen=True, slots=True)
+class TextBox:
+    """A free-standing text box on a custom slide."""
+    left: Length
+    top: Length
+    width: Length
+    height: Length
+    lines: list[Bullet]
+    # Defaults for every line, set once on the box's a:lstStyle instead of per paragraph
+    size: Optional[int] = None  # In points
+    font: Optional[str] = None
+
+@dataclass(frozen=True, slots=True)
+class CustomSlide:
+    """A blank-layout slide with a centered title box, its own text boxes, and speaker notes."""
+    title: str
+    textboxes: list[TextBox]
+    notes: str = ""
+
+@dataclass(frozen=True, slots=True)
+class TitleOnlySlide:
+    """A "Title Only" layout slide: the layout's title placeholder, text boxes, and speaker notes."""
+    title: str
+    textboxes: list[TextBox]
+    notes: str = ""
+
+@dataclass(frozen=True, slots=True)
+class TitleSlide:
+    """A "Title Slide" layout slide: a title, a subtitle, and speaker notes."""
+    title: str
+    subtitle: str
+    notes: str = ""
+
+@functools.lru_cache(maxsize=64)
+def _paragraph_properties(level, bold, italic, size, color, font, tag="a:pPr"):
+    """`a:pPr` markup for one formatting signature, or "" if it sets nothing.
+
+    The deck only uses a handful of signatures, so each is rendered once. `tag` also
+    allows the same properties as a list-style level such as `a:lvl1pPr`.
+    """
+    has_font = bold or italic or size is not None or color is not None or font is not None
+    if not (level or has_font):
+        return ""
+    lvl = f' lvl="{level}"' if level else ""
+    if not has_font:
+        return f"<{tag}{lvl}/>"
+    attrs = ""
+    if bold:
+        attrs += ' b="1"'
+    if italic:
+        attrs += ' i="1"'
+    if size is not None:
+        attrs += f' sz="{size * 100}"'
+    children = ""
+    if color is not None:
+        children += f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    if font is not None:
+        children += f'<a:latin typeface="{escape(font, _QUOTE)}"/>'
+    defRPr = f"<a:defRPr{attrs}>{children}</a:defRPr>" if children else f"<a:defRPr{attrs}/>"
+    return f"<{tag}{lvl}>{defRPr}</{tag}>"
+
+def _paragraph_xml(bullet):
+    """`a:p` markup for `bullet`; \\n and \\v become a:br between runs, like paragraph.text."""
+    pPr = _paragraph_properties(bullet.level, bullet.bold, bullet.italic,
+                                bullet.size, bullet.color, bullet.font)
+    runs = "<a:br/>".join(f"<a:r><a:t>{escape(line)}</a:t></a:r>" if line else ""
+                          for line in _LINE_BREAK.split(bullet.text))
+    return f"<a:p>{pPr}{runs}</a:p>"
+
+def build_txbody(tf, bullets, size=None, font=None):
+    """Replace the paragraphs of text frame `tf` with `bullets`.
+
+    The paragraphs are rendered as one XML string and parsed in a single call, rather
+    than built element by element. Formatting goes on each paragraph's
+    `a:pPr/a:defRPr`, the same place python-pptx's `paragraph.level` and
+    `paragraph.font` put it. `size` and `font`, if given, become the frame's default
+    run properties in `a:lstStyle`, which every paragraph inherits.
+    """
+    txBody = tf._txBody
+    for p in txBody.findall(_A_P):
+        txBody.remove(p)
+    if size is not None or font is not None:
+        lstStyle = parse_xml(_LIST_STYLE_XML % _paragraph_properties(
+            0, False, False, size, None, font, "a:lvl1pPr"))
+        # Text boxes always have an a:lstStyle; placeholders may not
+        old = txBody.find(_A_LSTSTYLE)
+        if old is not None:
+            txBody.replace(old, lstStyle)
+        else:
+            txBody.find(_A_BODYPR).addnext(lstStyle)
+    txBody.extend(parse_xml(_PARAGRAPHS_XML % "".join(map(_paragraph_xml, bullets))))
+
+def set_notes(slide, text):
+    """Set the speaker notes of `slide`, leaving slides without notes free of a notes part."""
+    if not text:
+        return
+    slide.notes_slide.notes_text_frame.text = text
+
+def open_slide(prs, layout):
+    """Add a slide using `layout` and return it with its title and body placeholders.
+
+    Both placeholders come from one pass over the slide's shapes.
+    """
+    slide = prs.slides.add_slide(layout)
+    placeholders = {ph.placeholder_format.idx: ph for ph in slide.placeholders}
+    return slide, placeholders[0], placeholders[1]
+
+def add_title_box(slide, text, size=PT32):
+    """Add the bold, centered title text box used on blank-layout slides."""
+    title_frame = slide.shapes.add_textbox(IN0_5, IN0_3, IN9, IN1).text_frame
+    title_frame.text = text
+    title_para = title_frame.paragraphs[0]
+    title_para.alignment = PP_ALIGN.CENTER
+    font = title_para.font
+    font.size = size
+    font.bold = True
+    return title_frame
+
+def render_title_slide(prs, layout, spec: TitleSlide):
+    """Add a "Title Slide" layout slide built from `spec`."""
+    slide, title, subtitle = open_slide(prs, layout)
+    title.text = spec.title
+    subtitle.text = spec.subtitle
+    return slide
+
+def render_bullet_slide(prs, layout, spec: BulletSlide):
+    """Add a "Title and Content" slide built from `spec`."""
+    slide, title, body = open_slide(prs, layout)
+    title.text = spec.title
+    build_txbody(body.text_frame, spec.bullets)
+    return slide
+
+def add_textboxes(slide, textboxes):
+    """Add each TextBox in `textboxes` to `slide`."""
+    for box in textboxes:
+        shape = slide.shapes.add_textbox(box.left, box.top, box.width, box.height)
+        build_txbody(shape.text_frame, box.lines, box.size, box.font)
+
+def render_custom_slide(prs, layout, spec: CustomSlide):
+    """Add a blank-layout slide built from `spec`."""
+    slide = prs.slides.add_slide(layout)
+    add_title_box(slide, spec.title)
+    add_textboxes(slide, spec.textboxes)
+    return slide
+
+def render_title_only_slide(prs, layout, spec: TitleOnlySlide):
+    """Add a "Title Only" layout slide built from `spec`; the master styles the title."""
+    slide = prs.slides.add_slide(layout)
+    slide.shapes.title.text = spec.title
+    add_textboxes(slide, spec.textboxes)
+    return slide
+
+# Slide 1: Title Slide
+TITLE_SLIDE = TitleSlide(
+    "Formalizing Latency in Distributed Systems and Its Role in Multi‑Agent LLM Coordination",
+    "Duration: ~20 minutes\nAudience: Systems researchers, ML engineers, distributed systems practitioners",
+    "Good morning/afternoon. Today I want to share a journey that started with a simple question: How do we let multiple LLMs have a conversation? This led me down a rabbit hole connecting 40 years of distributed systems theory with the cutting-edge challenges of orchestrating language models. By the end, you'll see why the pharynx - yes, your throat - might be the best mental model for understanding LLM coordination.",
+)
+
+# Slides 2-11
+BULLET_SLIDES = [
     # Slide 2: The Problem in One Image (Hook → Stakes)
-    bullet_slide_layout = prs.slide_layouts[1]
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "The Problem in One Image"
-    tf = body.text_frame
-    tf.text = "Uncoordinated LLMs break down."
-    tf.paragraphs[0].font.bold = True
-    tf.paragraphs[0].font.size = Pt(20)
-    
-    p = tf.add_paragraph()
-    p.text = "[ANIMATION: 3-Phase Visual Story]"
-    p.level = 1
-    p.font.italic = True
-    p.font.color.rgb = RGBColor(128, 128, 128)
-    
-    p = tf.add_paragraph()
-    p.text = "Phase 1: Three LLMs ready and initialized"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Phase 2: All start generating simultaneously" 
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Phase 3: Text streams collide → Garbled output"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "If we can't coordinate them, ensemble reasoning fails."
-    p.level = 0
-    p.font.bold = True
-    p.font.size = Pt(18)
-    
-    p = tf.add_paragraph()
-    p.text = "Each LLM must complete its entire response before processing new input"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Architecturally incapable of listening while speaking"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Uncoordinated LLMs break down. [SHOW 3-PHASE ANIMATION] Phase 1: Three LLMs - Claude, GPT-4, and Gemini - are initialized and ready, like processes waiting for a critical section. Phase 2: Without coordination, they all start generating text simultaneously - multiple processes entering the critical section at once. Phase 3: Their text streams collide and create garbled output - this is our race condition resulting in corrupted shared state. If we can't coordinate them, ensemble reasoning fails - multiple models can't vote, debate can't improve accuracy, and simulation breaks down. Unlike humans who can interrupt and adjust, each LLM, once started, must complete its entire response. The visual shows this as a classic coordination problem - like network packet collisions or database transaction conflicts."
-    
+    BulletSlide(
+        "The Problem in One Image",
+        [
+            Bullet("Uncoordinated LLMs break down.", bold=True, size=20),
+            Bullet("[ANIMATION: 3-Phase Visual Story]", 1, italic=True, color=GREY),
+            Bullet("Phase 1: Three LLMs ready and initialized", 1),
+            Bullet("Phase 2: All start generating simultaneously", 1),
+            Bullet("Phase 3: Text streams collide → Garbled output", 1),
+            Bullet("If we can't coordinate them, ensemble reasoning fails.", bold=True, size=18),
+            Bullet("Each LLM must complete its entire response before processing new input", 1),
+            Bullet("Architecturally incapable of listening while speaking", 1),
+        ],
+        "Uncoordinated LLMs break down. [SHOW 3-PHASE ANIMATION] Phase 1: Three LLMs - Claude, GPT-4, and Gemini - are initialized and ready, like processes waiting for a critical section. Phase 2: Without coordination, they all start generating text simultaneously - multiple processes entering the critical section at once. Phase 3: Their text streams collide and create garbled output - this is our race condition resulting in corrupted shared state. If we can't coordinate them, ensemble reasoning fails - multiple models can't vote, debate can't improve accuracy, and simulation breaks down. Unlike humans who can interrupt and adjust, each LLM, once started, must complete its entire response. The visual shows this as a classic coordination problem - like network packet collisions or database transaction conflicts.",
+    ),
     # Slide 3: Agenda
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Agenda"
-    tf = body.text_frame
-    tf.text = "1. Background - Formalizing latency & LLM architecture"
-    
-    p = tf.add_paragraph()
-    p.text = "2. Motivation - Why coordination matters"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "3. Method - The talking stick protocol"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "4. Results - What happened when we tried it"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "5. Implications - Lessons for system design"
-    p.level = 0
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "We'll start with the theoretical foundations - how computer science has formalized time and delay. Then we'll see why LLMs break our usual assumptions. I'll show you a protocol we implemented, share some surprising results, and discuss what this means for building multi-agent AI systems."
-    
+    BulletSlide(
+        "Agenda",
+        [
+            Bullet("1. Background - Formalizing latency & LLM architecture"),
+            Bullet("2. Motivation - Why coordination matters"),
+            Bullet("3. Method - The talking stick protocol"),
+            Bullet("4. Results - What happened when we tried it"),
+            Bullet("5. Implications - Lessons for system design"),
+        ],
+        "We'll start with the theoretical foundations - how computer science has formalized time and delay. Then we'll see why LLMs break our usual assumptions. I'll show you a protocol we implemented, share some surprising results, and discuss what this means for building multi-agent AI systems.",
+    ),
     # Slide 4: Latency Models & Synchrony (Compressed Background)
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Latency Models & Synchrony"
-    tf = body.text_frame
-    tf.text = "Four formal approaches to reasoning about delay:"
-    
-    p = tf.add_paragraph()
-    p.text = "Temporal Logic (requirements) • Network Calculus (bounds) • Process Calculi (composition) • Queuing Theory (statistics)"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "The Synchrony Spectrum:"
-    p.level = 0
-    p.font.bold = True
-    
-    p = tf.add_paragraph()
-    p.text = "Asynchronous ←→ Partially Synchronous ←→ Synchronous"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Internet/Email ←→ Datacenter/Raft ←→ CPU bus/Clock"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Key insight: What you can build depends on timing assumptions"
-    p.level = 0
-    p.font.bold = True
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Computer science offers multiple lenses for reasoning about delay - from temporal logic requirements to statistical queuing models. The key insight from distributed systems: what you can build depends on timing assumptions. Messages arrive 'eventually' on the Internet, 'usually bounded' in datacenters, or 'always within Δ' on CPU buses. Bounded time changes what's possible. Given that, how does it shape LLMs?"
-    
+    BulletSlide(
+        "Latency Models & Synchrony",
+        [
+            Bullet("Four formal approaches to reasoning about delay:"),
+            Bullet("Temporal Logic (requirements) • Network Calculus (bounds) • Process Calculi (composition) • Queuing Theory (statistics)", 1),
+            Bullet("The Synchrony Spectrum:", bold=True),
+            Bullet("Asynchronous ←→ Partially Synchronous ←→ Synchronous", 1),
+            Bullet("Internet/Email ←→ Datacenter/Raft ←→ CPU bus/Clock", 1),
+            Bullet("Key insight: What you can build depends on timing assumptions", bold=True),
+        ],
+        "Computer science offers multiple lenses for reasoning about delay - from temporal logic requirements to statistical queuing models. The key insight from distributed systems: what you can build depends on timing assumptions. Messages arrive 'eventually' on the Internet, 'usually bounded' in datacenters, or 'always within Δ' on CPU buses. Bounded time changes what's possible. Given that, how does it shape LLMs?",
+    ),
     # Slide 5: Why Timing Bounds Matter (Examples)
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Why Timing Bounds Matter"
-    tf = body.text_frame
-    tf.text = "Without bounds (async) vs With bounds (sync):"
-    
-    p = tf.add_paragraph()
-    p.text = "❌ Consensus impossible with 1 failure (FLP theorem)"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "✅ Byzantine consensus tolerates 1/3 failures"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "❌ Cannot detect failures perfectly"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "✅ Timeout = failure (if no heartbeat for 2Δ)"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Real example: Credit cards work globally because financial networks have timing bounds"
-    p.level = 0
-    p.font.bold = True
-    p.font.italic = True
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "This isn't academic trivia. The famous FLP theorem proves consensus is impossible in asynchronous systems with even one failure. But add timing bounds? You can tolerate up to 1/3 Byzantine failures and detect failures perfectly. This is why your credit card works at any ATM globally - there are timing bounds in the financial network. Bounded time changes what's possible."
-    
+    BulletSlide(
+        "Why Timing Bounds Matter",
+        [
+            Bullet("Without bounds (async) vs With bounds (sync):"),
+            Bullet("❌ Consensus impossible with 1 failure (FLP theorem)", 1),
+            Bullet("✅ Byzantine consensus tolerates 1/3 failures", 1),
+            Bullet("❌ Cannot detect failures perfectly", 1),
+            Bullet("✅ Timeout = failure (if no heartbeat for 2Δ)", 1),
+            Bullet("Real example: Credit cards work globally because financial networks have timing bounds", bold=True, italic=True),
+        ],
+        "This isn't academic trivia. The famous FLP theorem proves consensus is impossible in asynchronous systems with even one failure. But add timing bounds? You can tolerate up to 1/3 Byzantine failures and detect failures perfectly. This is why your credit card works at any ATM globally - there are timing bounds in the financial network. Bounded time changes what's possible.",
+    ),
     # Slide 6: The Biological Analogy (Moved here for A-B-A' flow)
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "The Biological Analogy"
-    tf = body.text_frame
-    tf.text = "HUMAN THROAT                    LLM PIPELINE"
-    
-    p = tf.add_paragraph()
-    p.text = "     ↓                               ↓"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "[Air/Food] → Pharynx → [Lungs/Stomach]    [Input] → Attention → [Output]"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "              ↑                                        ↑"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "        Single channel                          Single context"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "        Can't do both                          Can't do both"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "So far we saw how timing bounds determine what's possible in distributed systems; now let's see how this connects to LLMs. Here's a mental model that clicked for me. Humans face a similar constraint - we breathe and eat through the same tube. The pharynx is a single point of failure. Evolution's solution? The epiglottis - a valve that switches between modes. We literally hold our breath to swallow. LLMs need a similar mechanism - a protocol to switch between listening and speaking modes."
-    
-    
-    
-    
-    
+    BulletSlide(
+        "The Biological Analogy",
+        [
+            Bullet("HUMAN THROAT                    LLM PIPELINE"),
+            Bullet("     ↓                               ↓", 1),
+            Bullet("[Air/Food] → Pharynx → [Lungs/Stomach]    [Input] → Attention → [Output]", 1),
+            Bullet("              ↑                                        ↑", 1),
+            Bullet("        Single channel                          Single context", 1),
+            Bullet("        Can't do both                          Can't do both", 1),
+        ],
+        "So far we saw how timing bounds determine what's possible in distributed systems; now let's see how this connects to LLMs. Here's a mental model that clicked for me. Humans face a similar constraint - we breathe and eat through the same tube. The pharynx is a single point of failure. Evolution's solution? The epiglottis - a valve that switches between modes. We literally hold our breath to swallow. LLMs need a similar mechanism - a protocol to switch between listening and speaking modes.",
+    ),
     # Slide 7: LLM Architecture Primer
-    bullet_slide_layout = prs.slide_layouts[1]
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "LLM Architecture: Two Distinct Phases"
-    tf = body.text_frame
-    tf.text = "Input: \"What is the capital of France?\""
-    
-    p = tf.add_paragraph()
-    p.text = "         ↓"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "┌─────────────────┐"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "│     PREFILL     │ (Process all input tokens in parallel)"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "│  Compute KV     │ Time: ~50ms for 1K tokens"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "│  Cache for all  │ Bottleneck: FLOPS - can be parallelized"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "└─────────────────┘"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "         ↓"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "┌─────────────────┐"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "│    GENERATE     │ (Produce one token at a time)"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "│  The... →       │ Time: ~30ms per token"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "│  capital... →   │ Bottleneck: Memory bandwidth"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "│  is... →        │ Each token depends on ALL previous tokens"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "│  Paris.         │ ❌ CANNOT BE INTERRUPTED"
-    p.level = 1
-    p.font.bold = True
-    
-    p = tf.add_paragraph()
-    p.text = "└─────────────────┘"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "So far we saw the biological analogy for single-channel constraints; now let's see the technical details of how LLMs actually work. LLMs have two distinct phases. Prefill processes your entire prompt in parallel - it's compute-bound, doing massive matrix multiplications. Generate produces one token at a time, each depending on all previous tokens - it's memory-bound, constantly loading cached attention values. Here's the critical constraint: once generation starts, the model cannot process new input until it's done. It's architecturally serial. This is crucial for distributed systems researchers to understand: LLMs are fundamentally different from traditional processes. In prefill, they process your entire prompt in parallel - like a massive matrix multiplication computing attention weights for all input tokens simultaneously. But generation is inherently sequential. Each new token depends on the attention-weighted combination of ALL previous tokens. This isn't a software choice - it's baked into the transformer mathematics. You cannot interrupt generation mid-stream because the attention mechanism requires the complete sequence. This breaks traditional distributed systems assumptions about interruptible processes."
-    
+    BulletSlide(
+        "LLM Architecture: Two Distinct Phases",
+        [
+            Bullet('Input: "What is the capital of France?"'),
+            # One paragraph per block; \v becomes a line break (a:br) inside it
+            Bullet("\v".join([
+                "         ↓",
+                "┌─────────────────┐",
+                "│     PREFILL     │ (Process all input tokens in parallel)",
+                "│  Compute KV     │ Time: ~50ms for 1K tokens",
+                "│  Cache for all  │ Bottleneck: FLOPS - can be parallelized",
+                "└─────────────────┘",
+                "         ↓",
+                "┌─────────────────┐",
+                "│    GENERATE     │ (Produce one token at a time)",
+                "│  The... →       │ Time: ~30ms per token",
+                "│  capital... →   │ Bottleneck: Memory bandwidth",
+                "│  is... →        │ Each token depends on ALL previous tokens",
+            ]), 1),
+            Bullet("│  Paris.         │ ❌ CANNOT BE INTERRUPTED", 1, bold=True),
+            Bullet("└─────────────────┘", 1),
+        ],
+        "So far we saw the biological analogy for single-channel constraints; now let's see the technical details of how LLMs actually work. LLMs have two distinct phases. Prefill processes your entire prompt in parallel - it's compute-bound, doing massive matrix multiplications. Generate produces one token at a time, each depending on all previous tokens - it's memory-bound, constantly loading cached attention values. Here's the critical constraint: once generation starts, the model cannot process new input until it's done. It's architecturally serial. This is crucial for distributed systems researchers to understand: LLMs are fundamentally different from traditional processes. In prefill, they process your entire prompt in parallel - like a massive matrix multiplication computing attention weights for all input tokens simultaneously. But generation is inherently sequential. Each new token depends on the attention-weighted combination of ALL previous tokens. This isn't a software choice - it's baked into the transformer mathematics. You cannot interrupt generation mid-stream because the attention mechanism requires the complete sequence. This breaks traditional distributed systems assumptions about interruptible processes.",
+    ),
     # Slide 8: The Sequential Bottleneck
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "The Sequential Bottleneck"
-    tf = body.text_frame
-    tf.text = "Time →"
-    
-    p = tf.add_paragraph()
-    p.text = "LLM-A: [PREFILL] → [GENERATING RESPONSE............] → [DONE]"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "                            ↑"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "LLM-B:            \"Hey, wait I want to say—\""
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "                   ❌ Cannot process until generation completes"
-    p.level = 1
-    p.font.bold = True
-    
-    p = tf.add_paragraph()
-    p.text = "Why this breaks distributed systems assumptions:"
-    p.level = 0
-    p.font.bold = True
-    
-    p = tf.add_paragraph()
-    p.text = "• Traditional processes: Can be interrupted at any instruction"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "• Traditional processes: Can receive signals mid-execution"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "• LLMs: Each token = f(ALL previous tokens) via attention"
-    p.level = 1
-    p.font.bold = True
-    
-    p = tf.add_paragraph()
-    p.text = "• LLMs: Mathematical dependency chain cannot be broken"
-    p.level = 1
-    p.font.bold = True
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "This is our core challenge and the key insight for distributed systems researchers. Once an LLM starts generating, it's like a printer from 1995 - you can't add pages to the queue until the current job finishes. Every token depends on all previous tokens through the attention mechanism. There's no architectural way to inject new information mid-stream. This isn't a software limitation or design choice - it's baked into the transformer mathematics. Traditional distributed systems assume processes can be interrupted, can receive signals, can checkpoint state. LLMs violate all these assumptions during generation."
-    
+    BulletSlide(
+        "The Sequential Bottleneck",
+        [
+            Bullet("Time →"),
+            Bullet("\v".join([
+                "LLM-A: [PREFILL] → [GENERATING RESPONSE............] → [DONE]",
+                "                            ↑",
+                'LLM-B:            "Hey, wait I want to say—"',
+            ]), 1),
+            Bullet("                   ❌ Cannot process until generation completes", 1, bold=True),
+            Bullet("Why this breaks distributed systems assumptions:", bold=True),
+            Bullet("• Traditional processes: Can be interrupted at any instruction", 1),
+            Bullet("• Traditional processes: Can receive signals mid-execution", 1),
+            Bullet("• LLMs: Each token = f(ALL previous tokens) via attention", 1, bold=True),
+            Bullet("• LLMs: Mathematical dependency chain cannot be broken", 1, bold=True),
+        ],
+        "This is our core challenge and the key insight for distributed systems researchers. Once an LLM starts generating, it's like a printer from 1995 - you can't add pages to the queue until the current job finishes. Every token depends on all previous tokens through the attention mechanism. There's no architectural way to inject new information mid-stream. This isn't a software limitation or design choice - it's baked into the transformer mathematics. Traditional distributed systems assume processes can be interrupted, can receive signals, can checkpoint state. LLMs violate all these assumptions during generation.",
+    ),
     # Slide 9: The Staleness Problem (Moved here for constraint → symptom → motivation flow)
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "The Staleness Problem"
-    tf = body.text_frame
-    tf.text = "T=0s:   A sees: []                    B sees: []"
-    
-    p = tf.add_paragraph()
-    p.text = "T=1s:   A says: \"Hello\"               B generating: \"Hi there...\""
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "T=3s:   A says: \"How are you?\"        B still generating..."
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "T=5s:   A says: \"Hello?\"              B completes: \"Hi there, nice to meet you!\""
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "                                      (B never saw A's 2nd and 3rd messages)"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Staleness compounds quickly. LLM-A sends three messages while B generates one response. When B finally speaks, it's responding to ancient history. It's like having a conversation over postal mail - by the time your letter arrives, the context has shifted. In human conversation, we use backchannels - 'uh-huh', 'right' - to stay synchronized. LLMs can't do this. [ENERGY RESET: Ask audience - 'Any guess who grabs the stick first?' to keep engagement at midpoint]"
-    
+    BulletSlide(
+        "The Staleness Problem",
+        [
+            Bullet("T=0s:   A sees: []                    B sees: []"),
+            Bullet('T=1s:   A says: "Hello"               B generating: "Hi there..."', 1),
+            Bullet('T=3s:   A says: "How are you?"        B still generating...', 1),
+            Bullet('T=5s:   A says: "Hello?"              B completes: "Hi there, nice to meet you!"', 1),
+            Bullet("                                      (B never saw A's 2nd and 3rd messages)", 1),
+        ],
+        "Staleness compounds quickly. LLM-A sends three messages while B generates one response. When B finally speaks, it's responding to ancient history. It's like having a conversation over postal mail - by the time your letter arrives, the context has shifted. In human conversation, we use backchannels - 'uh-huh', 'right' - to stay synchronized. LLMs can't do this. [ENERGY RESET: Ask audience - 'Any guess who grabs the stick first?' to keep engagement at midpoint]",
+    ),
     # Slide 10: Why Coordinate Multiple LLMs?
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Why Coordinate Multiple LLMs?"
-    tf = body.text_frame
-    tf.text = "1. Ensemble Reasoning: Multiple models vote on answers"
-    
-    p = tf.add_paragraph()
-    p.text = "Like random forests for LLMs"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Reduces individual model errors"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "2. Adversarial Debate: Models argue positions to find truth"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "Improves factual accuracy through peer review"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "3. Role-Play Simulation: Models embody different perspectives"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "Complex social dynamics modeling"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Decision-making simulation"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Why bother? Three compelling use cases. First, ensemble reasoning - like random forests for LLMs, multiple models can vote to reduce errors. Second, adversarial debate - having models argue improves factual accuracy, like peer review. Third, simulation - modeling complex social dynamics or decision-making. But all three break down if responses are based on stale context. Coordination isn't optional."
-    
+    BulletSlide(
+        "Why Coordinate Multiple LLMs?",
+        [
+            Bullet("1. Ensemble Reasoning: Multiple models vote on answers"),
+            Bullet("Like random forests for LLMs", 1),
+            Bullet("Reduces individual model errors", 1),
+            Bullet("2. Adversarial Debate: Models argue positions to find truth"),
+            Bullet("Improves factual accuracy through peer review", 1),
+            Bullet("3. Role-Play Simulation: Models embody different perspectives"),
+            Bullet("Complex social dynamics modeling", 1),
+            Bullet("Decision-making simulation", 1),
+        ],
+        "Why bother? Three compelling use cases. First, ensemble reasoning - like random forests for LLMs, multiple models can vote to reduce errors. Second, adversarial debate - having models argue improves factual accuracy, like peer review. Third, simulation - modeling complex social dynamics or decision-making. But all three break down if responses are based on stale context. Coordination isn't optional.",
+    ),
     # Slide 11: Design Space for Coordination
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Design Space: Options We Considered"
-    tf = body.text_frame
-    tf.text = "Four approaches we explored:"
-    tf.paragraphs[0].font.bold = True
-    
-    p = tf.add_paragraph()
-    p.text = "• Token interrupts (keystroke sync) - maximum responsiveness, terrible efficiency"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "• Chunk-based turns (walkie-talkie) - speak in paragraphs"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "• Priority requests (speaking queue) - bid for speaking time"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "• Parallel drafts (operational transform) - merge like Google Docs"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "We picked Talking Stick because:"
-    p.level = 0
-    p.font.bold = True
-    
-    p = tf.add_paragraph()
-    p.text = "✓ Simple to implement and understand"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "✓ Natural social pressure mechanisms"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "✓ Graceful degradation under race conditions"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "So far we saw the problem and motivation for coordination; now let's see our approach. We explored four approaches, each with trade-offs between responsiveness and implementation complexity. Token-level interrupts give maximum responsiveness but terrible efficiency. Chunk-based turns work like a walkie-talkie. Priority requests let agents bid for speaking time. Parallel drafts merge simultaneously like Google Docs. We picked the talking stick because it's simple to implement, has natural social pressure mechanisms, and degrades gracefully under race conditions."
-    
-    
-    
-    
-    
-    
-    slide_layout = prs.slide_layouts[6]  # Blank layout for custom content
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "The Talking Stick Protocol"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # State diagram section
-    diagram_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(4.5), Inches(4))
-    diagram_frame = diagram_box.text_frame
-    diagram_frame.text = "State Diagram:"
-    
-    # Add state diagram in monospace font
-    p = diagram_frame.add_paragraph()
-    p.text = """    ┌─────────────┐
+    BulletSlide(
+        "Design Space: Options We Considered",
+        [
+            Bullet("Four approaches we explored:", bold=True),
+            Bullet("• Token interrupts (keystroke sync) - maximum responsiveness, terrible efficiency", 1),
+            Bullet("• Chunk-based turns (walkie-talkie) - speak in paragraphs", 1),
+            Bullet("• Priority requests (speaking queue) - bid for speaking time", 1),
+            Bullet("• Parallel drafts (operational transform) - merge like Google Docs", 1),
+            Bullet("We picked Talking Stick because:", bold=True),
+            Bullet("✓ Simple to implement and understand", 1),
+            Bullet("✓ Natural social pressure mechanisms", 1),
+            Bullet("✓ Graceful degradation under race conditions", 1),
+        ],
+        "So far we saw the problem and motivation for coordination; now let's see our approach. We explored four approaches, each with trade-offs between responsiveness and implementation complexity. Token-level interrupts give maximum responsiveness but terrible efficiency. Chunk-based turns work like a walkie-talkie. Priority requests let agents bid for speaking time. Parallel drafts merge simultaneously like Google Docs. We picked the talking stick because it's simple to implement, has natural social pressure mechanisms, and degrades gracefully under race conditions.",
+    ),
+]
+
+STATE_DIAGRAM = """    ┌─────────────┐
     │   WAITING   │←────────────┐
     └──────┬──────┘             │
            │                    │
@@ -501,55 +384,8 @@ def create_agent1_slides():
         push()                  │
            │                    │
            └────────────────────┘"""
-    p.font.name = 'Courier New'
-    p.font.size = Pt(12)
-    
-    # API section
-    api_box = slide.shapes.add_textbox(Inches(5.5), Inches(1.5), Inches(4), Inches(4))
-    api_frame = api_box.text_frame
-    api_frame.text = "API:"
-    api_frame.paragraphs[0].font.bold = True
-    
-    api_methods = [
-        "• talking_stick() - Request exclusive speaking rights",
-        "• append(text) - Stage message content",
-        "• push() - Publish to shared chat", 
-        "• check() - Poll for updates"
-    ]
-    
-    for method in api_methods:
-        p = api_frame.add_paragraph()
-        p.text = method
-        p.level = 0
-        p.font.size = Pt(14)
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "We implemented the simplest thing that could work - a talking stick. Like the speaking tradition in some Indigenous councils, whoever holds the stick has the floor. The protocol has four primitives. First, request the stick. Then append your message - you can do this multiple times for long messages. Push to publish. And constantly check for updates. It's polling-based, not event-driven, which has implications we'll see. [Note: If time runs short, combine this slide with the next System Feedback slide.]"
-    
-    # Slide 14: System Feedback Mechanisms
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "System Feedback Mechanisms"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Chat interface mockup
-    chat_box = slide.shapes.add_textbox(Inches(1.5), Inches(1.5), Inches(7), Inches(4))
-    chat_frame = chat_box.text_frame
-    chat_frame.text = "Chat Interface:"
-    chat_frame.paragraphs[0].font.bold = True
-    chat_frame.paragraphs[0].font.size = Pt(16)
-    
-    # Chat content with box outline
-    p = chat_frame.add_paragraph()
-    p.text = """┌─────────────────────────────────────┐
+
+CHAT_MOCKUP = """┌─────────────────────────────────────┐
 │ Dwight: "Hi everyone!"              │
 │                                     │
 │ [System: Jim has claimed the        │
@@ -558,76 +394,16 @@ def create_agent1_slides():
 │ [System: Michael has been waiting   │
 │  for a response for 4 seconds...]   │
 └─────────────────────────────────────┘"""
-    p.font.name = 'Courier New'
-    p.font.size = Pt(14)
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "The secret sauce is system messages that create social pressure. When someone claims the stick, everyone sees it. When someone's been waiting, there's a gentle nudge. It's like seeing someone's hand raised in a Zoom call - you naturally want to yield. These ambient cues coordinate behavior without strict enforcement."
-    
-    # Slide 15: The Experiment Setup
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "The Experiment Setup"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Three participant panels
-    panels_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(3))
-    panels_frame = panels_box.text_frame
-    panels_frame.text = """┌──────────────┐  ┌──────────────┐  ┌──────────────┐
+
+PERSONA_PANELS = """┌──────────────┐  ┌──────────────┐  ┌──────────────┐
 │   DWIGHT     │  │     JIM      │  │   MICHAEL    │
 │              │  │              │  │              │
 │ "Interested  │  │ "Philosophy  │  │ "Black holes │
 │ in astro-    │  │ and moral    │  │ fascinate    │
 │ biology"     │  │ questions"   │  │ me!"         │
 └──────────────┘  └──────────────┘  └──────────────┘"""
-    panels_frame.paragraphs[0].font.name = 'Courier New'
-    panels_frame.paragraphs[0].font.size = Pt(12)
-    
-    # Task description
-    task_box = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(8), Inches(1.5))
-    task_frame = task_box.text_frame
-    task_frame.text = "Task: Have a natural conversation"
-    task_frame.paragraphs[0].font.size = Pt(16)
-    task_frame.paragraphs[0].font.bold = True
-    
-    p = task_frame.add_paragraph()
-    p.text = "Hidden context: One might be a murderer (they don't know this)"
-    p.font.size = Pt(14)
-    p.font.italic = True
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "So far we saw the method - the talking stick protocol; now let's see what happened when we tested it. We tested with three LLM instances, each with a persona. Dwight's into astrobiology, Jim likes philosophy, Michael loves black holes. We gave them a simple task - have a natural conversation. But here's the twist we didn't tell them - the system was actually trying to identify which one might be a murderer based on conversation patterns. This created an interesting dynamic we'll see unfold."
-    
-    # Slide 16: Timeline of Key Events
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Timeline of Key Events"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Gantt chart
-    gantt_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(4.5))
-    gantt_frame = gantt_box.text_frame
-    gantt_frame.text = "Gantt Chart:"
-    gantt_frame.paragraphs[0].font.bold = True
-    
-    p = gantt_frame.add_paragraph()
-    p.text = """Time (s) →  0    2    4    6    8    10   12   14
+
+GANTT_CHART = """Time (s) →  0    2    4    6    8    10   12   14
 Dwight:     ■■■──────■■■────────■■■──────■■■
             talk    check      talk     talk
 
@@ -638,413 +414,210 @@ Michael:    ────■■■──────────■■■──
               check         talk    check
             
 Events:     └─Intro─┘└Race┘└─Topics─┘└Philosophy┘"""
-    p.font.name = 'Courier New'
-    p.font.size = Pt(11)
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Here's what actually happened. The introduction phase worked perfectly - clean turn-taking. Then we hit our first race condition at T=6 - both Dwight and Jim claimed the stick simultaneously. The system handled it gracefully by just... letting both messages through. The conversation naturally evolved from interests to deeper philosophical questions about human nature and evil - remember, one might be a murderer."
-    
+
+API_METHODS = [
+    "• talking_stick() - Request exclusive speaking rights",
+    "• append(text) - Stage message content",
+    "• push() - Publish to shared chat", 
+    "• check() - Poll for updates"
+]
+
+RESULTS_TABLE = """| Metric | Value | Context |
+|--------|-------|---------|
+| Polling frequency | 0.3 Hz | Every ~3 seconds |
+| Average response latency | 4.2s | Time holding stick |
+| Race conditions | 2 | Both resolved naturally |
+| Message truncations | 3 | Due to token limits |
+| Conversation coherence | 94% | Human-rated score |
+| Total messages | 18 | Over 3 minutes |"""
+
+CONVERSATION_EXCERPT = """
+Jim: "Have either of you ever encountered real evil?"
+     ↑ [Philosophical probe - possibly revealing?]
+
+Michael: "I think most humans are fundamentally good,
+         but circumstances can corrupt."
+         ↑ [Optimistic response - deflecting?]
+
+Dwight: "Environment shapes us... life might exist
+        in unimaginable forms"
+        ↑ [Bridging science and philosophy]"""
+
+# Slides 13-18
+CUSTOM_SLIDES = [
+    # Slide 13: The Talking Stick Protocol
+    CustomSlide(
+        "The Talking Stick Protocol",
+        [
+            # State diagram section, in monospace font
+            TextBox(IN0_5, IN1_5, IN4_5, IN4, [
+                Bullet("State Diagram:"),
+                Bullet(STATE_DIAGRAM, size=12, font=COURIER),
+            ]),
+            # API section
+            TextBox(IN5_5, IN1_5, IN4, IN4, [
+                Bullet("API:", bold=True),
+                Bullet("\v".join(API_METHODS), size=14),
+            ]),
+        ],
+        "We implemented the simplest thing that could work - a talking stick. Like the speaking tradition in some Indigenous councils, whoever holds the stick has the floor. The protocol has four primitives. First, request the stick. Then append your message - you can do this multiple times for long messages. Push to publish. And constantly check for updates. It's polling-based, not event-driven, which has implications we'll see. [Note: If time runs short, combine this slide with the next System Feedback slide.]",
+    ),
+    # Slide 14: System Feedback Mechanisms
+    CustomSlide(
+        "System Feedback Mechanisms",
+        [
+            # Chat interface mockup, with box outline
+            TextBox(IN1_5, IN1_5, IN7, IN4, [
+                Bullet("Chat Interface:", bold=True, size=16),
+                Bullet(CHAT_MOCKUP, size=14, font=COURIER),
+            ]),
+        ],
+        "The secret sauce is system messages that create social pressure. When someone claims the stick, everyone sees it. When someone's been waiting, there's a gentle nudge. It's like seeing someone's hand raised in a Zoom call - you naturally want to yield. These ambient cues coordinate behavior without strict enforcement.",
+    ),
+    # Slide 15: The Experiment Setup
+    CustomSlide(
+        "The Experiment Setup",
+        [
+            # Three participant panels, one paragraph per line; only the first is styled
+            TextBox(IN0_5, IN1_5, IN9, IN3,
+                    [Bullet(PERSONA_PANELS.split("\n")[0], size=12, font=COURIER)]
+                    + [Bullet(line) for line in PERSONA_PANELS.split("\n")[1:]]),
+            # Task description
+            TextBox(IN1, IN5, IN8, IN1_5, [
+                Bullet("Task: Have a natural conversation", bold=True, size=16),
+                Bullet("Hidden context: One might be a murderer (they don't know this)", italic=True, size=14),
+            ]),
+        ],
+        "So far we saw the method - the talking stick protocol; now let's see what happened when we tested it. We tested with three LLM instances, each with a persona. Dwight's into astrobiology, Jim likes philosophy, Michael loves black holes. We gave them a simple task - have a natural conversation. But here's the twist we didn't tell them - the system was actually trying to identify which one might be a murderer based on conversation patterns. This created an interesting dynamic we'll see unfold.",
+    ),
+    # Slide 16: Timeline of Key Events
+    CustomSlide(
+        "Timeline of Key Events",
+        [
+            TextBox(IN0_5, IN1_5, IN9, IN4_5, [
+                Bullet("Gantt Chart:", bold=True),
+                Bullet(GANTT_CHART, size=11, font=COURIER),
+            ]),
+        ],
+        "Here's what actually happened. The introduction phase worked perfectly - clean turn-taking. Then we hit our first race condition at T=6 - both Dwight and Jim claimed the stick simultaneously. The system handled it gracefully by just... letting both messages through. The conversation naturally evolved from interests to deeper philosophical questions about human nature and evil - remember, one might be a murderer.",
+    ),
     # Slide 17: Quantitative Results
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Quantitative Results"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Results table
-    table_box = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(5))
-    table_frame = table_box.text_frame
-    table_frame.text = "Dashboard with key metrics:"
-    table_frame.paragraphs[0].font.bold = True
-    table_frame.paragraphs[0].font.size = Pt(16)
-    
-    # Table content
-    table_data = [
-        "| Metric | Value | Context |",
-        "|--------|-------|---------|",
-        "| Polling frequency | 0.3 Hz | Every ~3 seconds |",
-        "| Average response latency | 4.2s | Time holding stick |",
-        "| Race conditions | 2 | Both resolved naturally |",
-        "| Message truncations | 3 | Due to token limits |",
-        "| Conversation coherence | 94% | Human-rated score |",
-        "| Total messages | 18 | Over 3 minutes |"
-    ]
-    
-    for row in table_data:
-        p = table_frame.add_paragraph()
-        p.text = row
-        p.font.name = 'Courier New'
-        p.font.size = Pt(12)
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "The numbers tell an interesting story. Polling dominated network traffic - every 3 seconds, each LLM checked for updates. The average 'thinking time' while holding the stick was 4.2 seconds. We saw two race conditions where multiple LLMs claimed the stick - both resolved without intervention. Despite truncation issues and races, human raters scored the conversation as 94% coherent. Not bad for a distributed system with no central coordinator!"
-    
+    CustomSlide(
+        "Quantitative Results",
+        [
+            TextBox(IN1, IN1_5, IN8, IN5, [
+                Bullet("Dashboard with key metrics:", bold=True, size=16),
+                Bullet(RESULTS_TABLE, size=12, font=COURIER),
+            ]),
+        ],
+        "The numbers tell an interesting story. Polling dominated network traffic - every 3 seconds, each LLM checked for updates. The average 'thinking time' while holding the stick was 4.2 seconds. We saw two race conditions where multiple LLMs claimed the stick - both resolved without intervention. Despite truncation issues and races, human raters scored the conversation as 94% coherent. Not bad for a distributed system with no central coordinator!",
+    ),
     # Slide 18: Qualitative Observations
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Qualitative Observations"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Conversation excerpt with annotations
-    convo_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
-    convo_frame = convo_box.text_frame
-    convo_frame.text = "Conversation excerpt with annotations:"
-    convo_frame.paragraphs[0].font.bold = True
-    convo_frame.paragraphs[0].font.size = Pt(16)
-    
-    # Conversation content
-    convo_content = [
-        '',
-        'Jim: "Have either of you ever encountered real evil?"',
-        '     ↑ [Philosophical probe - possibly revealing?]',
-        '',
-        'Michael: "I think most humans are fundamentally good,',
-        '         but circumstances can corrupt."',
-        '         ↑ [Optimistic response - deflecting?]',
-        '',
-        'Dwight: "Environment shapes us... life might exist',
-        '        in unimaginable forms"',
-        '        ↑ [Bridging science and philosophy]'
-    ]
-    
-    for line in convo_content:
-        p = convo_frame.add_paragraph()
-        p.text = line
-        p.font.name = 'Courier New'
-        p.font.size = Pt(12)
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "The conversation took a fascinating turn. Jim steered toward moral philosophy and asked about 'real evil' - significant given the hidden murder context. Michael gave an optimistic response about human nature. Dwight tried to bridge both topics. What emerged wasn't just functional communication but genuinely interesting discourse. The protocol enabled but didn't constrain the natural flow of ideas."
-    
+    TitleOnlySlide(
+        "Qualitative Observations",
+        [
+            # Conversation excerpt with annotations
+            TextBox(IN0_5, IN1_5, IN9, IN5, [
+                Bullet("Conversation excerpt with annotations:", bold=True, size=16),
+                Bullet(CONVERSATION_EXCERPT, size=12, font=COURIER),
+            ]),
+        ],
+        "The conversation took a fascinating turn. Jim steered toward moral philosophy and asked about 'real evil' - significant given the hidden murder context. Michael gave an optimistic response about human nature. Dwight tried to bridge both topics. What emerged wasn't just functional communication but genuinely interesting discourse. The protocol enabled but didn't constrain the natural flow of ideas.",
+    ),
+]
 
+# Slides 19-23
+CLOSING_SLIDES = [
     # Slide 19: Emergent Behaviors
-    bullet_slide_layout = prs.slide_layouts[1]
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Emergent Behaviors"
-    tf = body.text_frame
-    tf.text = "1. Conversational Crossed Wires"
-    
-    p = tf.add_paragraph()
-    p.text = "Natural misalignments that happen in real conversation"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Example: Jim answering a question just as it was asked"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "2. Social Pressure Dynamics"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "'Waiting for 4 seconds' created urgency to respond"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Self-regulating without hard limits"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "3. Topic Convergence"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "Started with separate interests"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Naturally found common ground in philosophy"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Protocol enabled but didn't force this"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "So far we saw the quantitative and qualitative results from our experiment; now let's see what unexpected behaviors emerged. Three behaviors emerged that we didn't explicitly design for. First, conversational crossed wires - like when Jim revealed his interests just as Dwight asked about them. This felt natural, not like a bug. Second, the waiting notifications created organic pressure to keep things moving. Third, despite starting with different topics - space, philosophy, black holes - the conversation naturally converged. The protocol provided structure without strangling spontaneity. These behaviors inform system design lessons."
-    
+    BulletSlide(
+        "Emergent Behaviors",
+        [
+            Bullet("1. Conversational Crossed Wires"),
+            Bullet("Natural misalignments that happen in real conversation", 1),
+            Bullet("Example: Jim answering a question just as it was asked", 1),
+            Bullet("2. Social Pressure Dynamics"),
+            Bullet("'Waiting for 4 seconds' created urgency to respond", 1),
+            Bullet("Self-regulating without hard limits", 1),
+            Bullet("3. Topic Convergence"),
+            Bullet("Started with separate interests", 1),
+            Bullet("Naturally found common ground in philosophy", 1),
+            Bullet("Protocol enabled but didn't force this", 1),
+        ],
+        "So far we saw the quantitative and qualitative results from our experiment; now let's see what unexpected behaviors emerged. Three behaviors emerged that we didn't explicitly design for. First, conversational crossed wires - like when Jim revealed his interests just as Dwight asked about them. This felt natural, not like a bug. Second, the waiting notifications created organic pressure to keep things moving. Third, despite starting with different topics - space, philosophy, black holes - the conversation naturally converged. The protocol provided structure without strangling spontaneity. These behaviors inform system design lessons.",
+    ),
     # Slide 20: Lessons for System Design
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Lessons for System Design"
-    tf = body.text_frame
-    tf.text = "Challenge → Traditional Solution → LLM Reality"
-    
-    p = tf.add_paragraph()
-    p.text = "Concurrency → Threads + locks → Sequential by design"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Interruption → Signals/callbacks → Must complete generation"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Coordination → Event-driven → Polling + social cues"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Consistency → ACID/eventual → Embrace crossed wires"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "LLMs break our usual distributed systems playbook. We can't use threads - generation is inherently sequential. We can't interrupt - the attention mechanism requires completing the sequence. Event-driven architectures assume immediate response - LLMs need seconds to think. Perhaps most importantly, perfect consistency might be wrong - those crossed wires made the conversation more human."
-    
+    BulletSlide(
+        "Lessons for System Design",
+        [
+            Bullet("Challenge → Traditional Solution → LLM Reality"),
+            Bullet("Concurrency → Threads + locks → Sequential by design", 1),
+            Bullet("Interruption → Signals/callbacks → Must complete generation", 1),
+            Bullet("Coordination → Event-driven → Polling + social cues", 1),
+            Bullet("Consistency → ACID/eventual → Embrace crossed wires", 1),
+        ],
+        "LLMs break our usual distributed systems playbook. We can't use threads - generation is inherently sequential. We can't interrupt - the attention mechanism requires completing the sequence. Event-driven architectures assume immediate response - LLMs need seconds to think. Perhaps most importantly, perfect consistency might be wrong - those crossed wires made the conversation more human.",
+    ),
     # Slide 21: The Staleness-Liveness Tradeoff
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "The Staleness-Liveness Tradeoff"
-    tf = body.text_frame
-    tf.text = "Fundamental tradeoff in LLM coordination:"
-    
-    p = tf.add_paragraph()
-    p.text = "Liveness ↑"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "    │ Our protocol"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "    │     ★"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "    │   ╱  Ideal (impossible?)"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "    │ ╱"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "    └─────────────→ Staleness"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Lower staleness = More interruptions = Less liveness"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "Higher liveness = Longer responses = More staleness"
-    p.level = 0
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "We face a fundamental tradeoff. Reduce staleness by checking more often, and you sacrifice liveness - conversations become choppy. Improve liveness with longer uninterrupted responses, and staleness accumulates. Our protocol found a middle ground, but the perfect solution might not exist. It's CAP theorem for conversations - you can't have perfect coherence, availability, and partition tolerance."
-    
+    BulletSlide(
+        "The Staleness-Liveness Tradeoff",
+        [
+            Bullet("Fundamental tradeoff in LLM coordination:"),
+            Bullet("Liveness ↑", 1),
+            Bullet("    │ Our protocol", 1),
+            Bullet("    │     ★", 1),
+            Bullet("    │   ╱  Ideal (impossible?)", 1),
+            Bullet("    │ ╱", 1),
+            Bullet("    └─────────────→ Staleness", 1),
+            Bullet("Lower staleness = More interruptions = Less liveness"),
+            Bullet("Higher liveness = Longer responses = More staleness"),
+        ],
+        "We face a fundamental tradeoff. Reduce staleness by checking more often, and you sacrifice liveness - conversations become choppy. Improve liveness with longer uninterrupted responses, and staleness accumulates. Our protocol found a middle ground, but the perfect solution might not exist. It's CAP theorem for conversations - you can't have perfect coherence, availability, and partition tolerance.",
+    ),
     # Slide 22: Future Directions
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Future Directions"
-    tf = body.text_frame
-    tf.text = "Research roadmap from current state:"
-    
-    p = tf.add_paragraph()
-    p.text = "Current: Polling + Talking Stick"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "           │"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "           ├─→ Event-Driven Updates"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "           │   (WebSockets, push notifications)"
-    p.level = 2
-    
-    p = tf.add_paragraph()
-    p.text = "           ├─→ Predictive Protocols"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "           │   (Start prefill before your turn)"
-    p.level = 2
-    
-    p = tf.add_paragraph()
-    p.text = "           └─→ Architectural Changes"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "               (Streamable attention?)"
-    p.level = 2
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Where do we go from here? Three promising directions. First, replace polling with event-driven updates - reduce that network overhead. Second, predictive protocols - start processing likely responses before it's your turn, like speculative execution for conversation. Most ambitiously, could we modify the transformer architecture itself to allow streaming attention updates? That would solve the root cause, not just manage symptoms."
-    
+    BulletSlide(
+        "Future Directions",
+        [
+            Bullet("Research roadmap from current state:"),
+            Bullet("Current: Polling + Talking Stick", 1),
+            Bullet("           │", 1),
+            Bullet("           ├─→ Event-Driven Updates", 1),
+            Bullet("           │   (WebSockets, push notifications)", 2),
+            Bullet("           ├─→ Predictive Protocols", 1),
+            Bullet("           │   (Start prefill before your turn)", 2),
+            Bullet("           └─→ Architectural Changes", 1),
+            Bullet("               (Streamable attention?)", 2),
+        ],
+        "Where do we go from here? Three promising directions. First, replace polling with event-driven updates - reduce that network overhead. Second, predictive protocols - start processing likely responses before it's your turn, like speculative execution for conversation. Most ambitiously, could we modify the transformer architecture itself to allow streaming attention updates? That would solve the root cause, not just manage symptoms.",
+    ),
     # Slide 23: Key Takeaways
-    slide = prs.slides.add_slide(bullet_slide_layout)
-    title = slide.shapes.title
-    body = slide.placeholders[1]
-    
-    title.text = "Key Takeaways"
-    tf = body.text_frame
-    tf.text = "1. Latency bounds unlock capabilities"
-    
-    p = tf.add_paragraph()
-    p.text = "From FLP impossibility to Byzantine consensus"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Time assumptions determine what's buildable"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "2. LLMs have a hard architectural constraint"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "Sequential generation is not a bug but a feature"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Need protocols that embrace, not fight this"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "3. Simple protocols can enable complex behavior"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "Talking stick + social pressure = coherent conversation"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Emergence happens at the protocol boundary"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "4. Perfect coordination might be undesirable"
-    p.level = 0
-    
-    p = tf.add_paragraph()
-    p.text = "Crossed wires make conversations human"
-    p.level = 1
-    
-    p = tf.add_paragraph()
-    p.text = "Some staleness creates authenticity"
-    p.level = 1
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Four insights to leave you with. First, the 40-year lesson from distributed systems remains true - time bounds determine what's possible. Second, LLMs' sequential nature isn't a limitation to overcome but a constraint to design around. Third, simple protocols can enable surprisingly complex behavior - our basic talking stick led to philosophical discourse. Finally, and perhaps most surprisingly, perfect coordination might be wrong. Those messy overlaps and misalignments? They're not bugs - they're what make conversation feel real."
-    
-    # Slide 24: Questions?
-    title_slide_layout = prs.slide_layouts[0]
-    slide = prs.slides.add_slide(title_slide_layout)
-    title = slide.shapes.title
-    subtitle = slide.placeholders[1]
-    
-    title.text = "Questions?"
-    subtitle.text = "Contact and Resources:\n\n• Protocol implementation (GitHub)\n• Full conversation transcript\n• Related papers on bounded latency\n\nThank you!"
-    
-    # Add speaker notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    notes_text_frame.text = "Thank you. I'm happy to discuss any aspect - from the formal models to the implementation details to the philosophical questions our LLMs raised about human nature. And if you're wondering - we never did figure out which one was the murderer. Maybe the real mystery was the distributed systems we built along the way."
-    
-    # Backup Slides
-    
-    # Slide B1: Formal Staleness Definition
-    slide_layout = prs.slide_layouts[6]  # Blank layout for custom content
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Backup Slide B1: Formal Staleness Definition"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(28)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Content
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
-    content_frame = content_box.text_frame
-    content_frame.text = "For the theory-inclined:"
-    content_frame.paragraphs[0].font.bold = True
-    content_frame.paragraphs[0].font.size = Pt(16)
-    
-    p = content_frame.add_paragraph()
-    p.text = ""
-    
-    p = content_frame.add_paragraph()
-    p.text = "Staleness(t) = t - max{t' : t' ≤ t ∧ observed(state(t'))}"
-    p.font.name = 'Courier New'
-    p.font.size = Pt(16)
-    p.font.bold = True
-    
-    p = content_frame.add_paragraph()
-    p.text = ""
-    
-    p = content_frame.add_paragraph()
-    p.text = "Where:"
-    p.font.size = Pt(14)
-    p.font.bold = True
-    
-    definitions = [
-        "• t = current time",
-        "• state(t') = global state at time t'",
-        "• observed() = when state became visible to agent"
-    ]
-    
-    for definition in definitions:
-        p = content_frame.add_paragraph()
-        p.text = definition
-        p.font.size = Pt(14)
-    
-    # Slide B2: Protocol Pseudocode
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Backup Slide B2: Protocol Pseudocode"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(28)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Code content
-    code_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
-    code_frame = code_box.text_frame
-    code_frame.text = """class LLMAgent:
+    BulletSlide(
+        "Key Takeaways",
+        [
+            Bullet("1. Latency bounds unlock capabilities"),
+            Bullet("From FLP impossibility to Byzantine consensus", 1),
+            Bullet("Time assumptions determine what's buildable", 1),
+            Bullet("2. LLMs have a hard architectural constraint"),
+            Bullet("Sequential generation is not a bug but a feature", 1),
+            Bullet("Need protocols that embrace, not fight this", 1),
+            Bullet("3. Simple protocols can enable complex behavior"),
+            Bullet("Talking stick + social pressure = coherent conversation", 1),
+            Bullet("Emergence happens at the protocol boundary", 1),
+            Bullet("4. Perfect coordination might be undesirable"),
+            Bullet("Crossed wires make conversations human", 1),
+            Bullet("Some staleness creates authenticity", 1),
+        ],
+        "Four insights to leave you with. First, the 40-year lesson from distributed systems remains true - time bounds determine what's possible. Second, LLMs' sequential nature isn't a limitation to overcome but a constraint to design around. Third, simple protocols can enable surprisingly complex behavior - our basic talking stick led to philosophical discourse. Finally, and perhaps most surprisingly, perfect coordination might be wrong. Those messy overlaps and misalignments? They're not bugs - they're what make conversation feel real.",
+    ),
+]
+
+# Slide 24: Questions?
+QUESTIONS_SLIDE = TitleSlide(
+    "Questions?",
+    "Contact and Resources:\n\n• Protocol implementation (GitHub)\n• Full conversation transcript\n• Related papers on bounded latency\n\nThank you!",
+    "Thank you. I'm happy to discuss any aspect - from the formal models to the implementation details to the philosophical questions our LLMs raised about human nature. And if you're wondering - we never did figure out which one was the murderer. Maybe the real mystery was the distributed systems we built along the way.",
+)
+
+PROTOCOL_PSEUDOCODE = """class LLMAgent:
     async def converse(self):
         while not done:
             state = await check()
@@ -1055,116 +628,172 @@ Events:     └─Intro─┘└Race┘└─Topics─┘└Philosophy┘"""
                         await append(chunk)
                     await push()
             await sleep(POLL_INTERVAL)"""
-    code_frame.paragraphs[0].font.name = 'Courier New'
-    code_frame.paragraphs[0].font.size = Pt(12)
-    
+
+# Backup slides
+BACKUP_SLIDES = [
+    # Slide B1: Formal Staleness Definition
+    TitleOnlySlide(
+        "Backup Slide B1: Formal Staleness Definition",
+        [
+            # Content
+            TextBox(IN0_5, IN1_5, IN9, IN5, [
+                Bullet("For the theory-inclined:", bold=True, size=16),
+                Bullet(""),
+                Bullet("Staleness(t) = t - max{t' : t' ≤ t ∧ observed(state(t'))}", bold=True, size=16, font=COURIER),
+                Bullet(""),
+                Bullet("Where:", bold=True, size=14),
+                Bullet("\v".join([
+                    "• t = current time",
+                    "• state(t') = global state at time t'",
+                    "• observed() = when state became visible to agent",
+                ]), size=14),
+            ]),
+        ],
+    ),
+    # Slide B2: Protocol Pseudocode
+    TitleOnlySlide(
+        "Backup Slide B2: Protocol Pseudocode",
+        [
+            # Code content, one paragraph per line, all monospace via the box's list style
+            TextBox(IN0_5, IN1_5, IN9, IN5,
+                    [Bullet(line) for line in PROTOCOL_PSEUDOCODE.split("\n")],
+                    size=12, font=COURIER),
+        ],
+    ),
     # Slide B3: Race Condition Handling
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Backup Slide B3: Race Condition Handling"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(28)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Content
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
-    content_frame = content_box.text_frame
-    content_frame.text = "What happens when two agents claim the stick simultaneously?"
-    content_frame.paragraphs[0].font.bold = True
-    content_frame.paragraphs[0].font.size = Pt(16)
-    
-    race_steps = [
-        "",
-        "1. Both receive success (distributed systems are messy)",
-        "2. Both compose messages",
-        "3. Both push to chat",
-        "4. Messages appear in receipt order",
-        "5. Conversation continues naturally",
-        "",
-        "No explicit resolution needed!"
-    ]
-    
-    for step in race_steps:
-        p = content_frame.add_paragraph()
-        p.text = step
-        if step.startswith(("1.", "2.", "3.", "4.", "5.")):
-            p.font.size = Pt(14)
-        elif step == "No explicit resolution needed!":
-            p.font.size = Pt(16)
-            p.font.bold = True
-            p.font.italic = True
-        else:
-            p.font.size = Pt(14)
-    
+    TitleOnlySlide(
+        "Backup Slide B3: Race Condition Handling",
+        [
+            # Content
+            TextBox(IN0_5, IN1_5, IN9, IN5, [
+                Bullet("What happens when two agents claim the stick simultaneously?", bold=True, size=16),
+                Bullet("", size=14),
+                Bullet("\v".join([
+                    "1. Both receive success (distributed systems are messy)",
+                    "2. Both compose messages",
+                    "3. Both push to chat",
+                    "4. Messages appear in receipt order",
+                    "5. Conversation continues naturally",
+                ]), size=14),
+                Bullet("", size=14),
+                Bullet("No explicit resolution needed!", bold=True, italic=True, size=16),
+            ]),
+        ],
+    ),
     # Slide B4: Transformer Architecture Details (For Technical Deep-Dive)
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Backup Slide B4: Transformer Attention Mechanism"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(28)
-    title_para.font.bold = True
-    title_para.alignment = PP_ALIGN.CENTER
-    
-    # Technical content
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
-    content_frame = content_box.text_frame
-    content_frame.text = "Mathematical Foundation of Sequential Constraint:"
-    content_frame.paragraphs[0].font.bold = True
-    content_frame.paragraphs[0].font.size = Pt(16)
-    
-    p = content_frame.add_paragraph()
-    p.text = ""
-    
-    p = content_frame.add_paragraph()
-    p.text = "For token at position i, attention output:"
-    p.font.size = Pt(14)
-    
-    p = content_frame.add_paragraph()
-    p.text = "Attention(Q_i, K_{1:i}, V_{1:i}) = softmax(Q_i * K_{1:i}^T / √d_k) * V_{1:i}"
-    p.font.name = 'Courier New'
-    p.font.size = Pt(12)
-    
-    p = content_frame.add_paragraph()
-    p.text = ""
-    
-    p = content_frame.add_paragraph()
-    p.text = "Key Constraints:"
-    p.font.bold = True
-    p.font.size = Pt(14)
-    
-    technical_points = [
-        "• Causal masking: Token i can only attend to positions 1..i",
-        "• Autoregressive: P(x_i | x_1, ..., x_{i-1}) computed sequentially",
-        "• KV cache grows: O(sequence_length × hidden_dim) memory",
-        "• Each forward pass requires ALL previous hidden states",
-        "• No mathematical way to parallelize across output positions"
-    ]
-    
-    for point in technical_points:
-        p = content_frame.add_paragraph()
-        p.text = point
-        p.font.size = Pt(12)
-    
-    p = content_frame.add_paragraph()
-    p.text = ""
+    TitleOnlySlide(
+        "Backup Slide B4: Transformer Attention Mechanism",
+        [
+            # Technical content
+            TextBox(IN0_5, IN1_5, IN9, IN5, [
+                Bullet("Mathematical Foundation of Sequential Constraint:", bold=True, size=16),
+                Bullet(""),
+                Bullet("For token at position i, attention output:", size=14),
+                Bullet("Attention(Q_i, K_{1:i}, V_{1:i}) = softmax(Q_i * K_{1:i}^T / √d_k) * V_{1:i}", size=12, font=COURIER),
+                Bullet(""),
+                Bullet("Key Constraints:", bold=True, size=14),
+                Bullet("\v".join([
+                    "• Causal masking: Token i can only attend to positions 1..i",
+                    "• Autoregressive: P(x_i | x_1, ..., x_{i-1}) computed sequentially",
+                    "• KV cache grows: O(sequence_length × hidden_dim) memory",
+                    "• Each forward pass requires ALL previous hidden states",
+                    "• No mathematical way to parallelize across output positions",
+                ]), size=12),
+                Bullet(""),
+                Bullet("This is why LLMs cannot be interrupted mid-generation: breaking the causal chain invalidates all subsequent computations.", bold=True, italic=True, size=14),
+            ]),
+        ],
+    ),
+]
+
+SLIDE_SPECS = [TITLE_SLIDE, *BULLET_SLIDES, *CUSTOM_SLIDES, *CLOSING_SLIDES, QUESTIONS_SLIDE, *BACKUP_SLIDES]
+
+_HANDLERS = {
+    TitleSlide: render_title_slide,
+    BulletSlide: render_bullet_slide,
+    CustomSlide: render_custom_slide,
+    TitleOnlySlide: render_title_only_slide,
+}
+
+# The fast save path reuses python-pptx internals: _StoredPackageWriter._write mirrors
+# PackageWriter._write from python-pptx 1.0.2 with only the zip writer swapped. If
+# those internals are missing (a different python-pptx), save_presentation falls back
+# to the normal compressed save.
+try:
+    from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+except ImportError:
+    PackageWriter = _ZipPkgWriter = None
+
+_STORED_SAVE_SUPPORTED = (
+    _ZipPkgWriter is not None
+    and isinstance(vars(_ZipPkgWriter).get("_zipf"), lazyproperty)
+    and all(callable(getattr(PackageWriter, name, None)) for name in (
+        "write", "_write", "_write_content_types_stream", "_write_pkg_rels", "_write_parts"))
+    and all(hasattr(OpcPackage, name) for name in ("_rels", "iter_parts"))
+)
+
+if _STORED_SAVE_SUPPORTED:
+    class _StoredZipPkgWriter(_ZipPkgWriter):
+        """Zip writer that stores parts as-is instead of deflating them."""
+
+        @lazyproperty
+        def _zipf(self):
+            return zipfile.ZipFile(self._pkg_file, "w", compression=zipfile.ZIP_STORED, strict_timestamps=False)
+
+    class _StoredPackageWriter(PackageWriter):
+        """PackageWriter that writes through _StoredZipPkgWriter."""
+
+        def _write(self):
+            with _StoredZipPkgWriter(self._pkg_file) as phys_writer:
+                self._write_content_types_stream(phys_writer)
+                self._write_pkg_rels(phys_writer)
+                self._write_parts(phys_writer)
+
+def save_presentation(prs, filename, fast=False):
+    """Save `prs` to `filename`.
+
+    The package is assembled in memory and written to disk in one call, instead of
+    as many small writes while the zip is built. With `fast`, parts are stored
+    uncompressed, which skips DEFLATE for dev-loop builds at the cost of a larger file;
+    it quietly becomes a normal save if this python-pptx lacks the internals it uses.
+    """
+    buf = io.BytesIO()
+    if fast and _STORED_SAVE_SUPPORTED:
+        package = prs.part.package
+        _StoredPackageWriter.write(buf, package._rels, tuple(package.iter_parts()))
+    else:
+        prs.save(buf)
+    with open(filename, "wb") as f:
+        f.write(buf.getbuffer())
+
+def create_agent1_slides(fast=False, include_notes=True):
+    """Create slides 1-6 of the LLM Async Talk presentation
+
+    With `include_notes=False` no notes slides are created, so the saved deck has no
+    notes parts at all.
+    """
     
-    p = content_frame.add_paragraph()
-    p.text = "This is why LLMs cannot be interrupted mid-generation: breaking the causal chain invalidates all subsequent computations."
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.italic = True
+    # Create presentation object
+    prs = Presentation()
+    # Look up each layout once; slide_layouts indexing walks the master's XML
+    layouts = {
+        TitleSlide: prs.slide_layouts[0],
+        BulletSlide: prs.slide_layouts[1],
+        TitleOnlySlide: prs.slide_layouts[5],
+        CustomSlide: prs.slide_layouts[6],  # Blank layout for custom content
+    }
+    
+    for spec in SLIDE_SPECS:
+        kind = type(spec)
+        slide = _HANDLERS[kind](prs, layouts[kind], spec)
+        if include_notes:
+            set_notes(slide, spec.notes)
     
     # Save the presentation
     filename = "slides.pptx"
-    prs.save(filename)
+    save_presentation(prs, filename, fast=fast)
     
     
 if __name__ == "__main__":
-    create_agent1_slides()
\ No newline at end of file
+    # SLIDES_FAST=1 for dev-loop builds: same deck, stored instead of deflated
+    create_agent1_slides(fast=bool(os.environ.get("SLIDES_FAST")))
\ No newline at end of file
@@ -0,0 +1,55 @@
+import asyncio
+import io
+import unittest
+
+from prefixed_output import PrefixedOutput, run_with_prefix
+
+
+class InheritedLineBufferTest(unittest.TestCase):
+    """A partial line must stay with the context that wrote it, not leak into children."""
+
+    def setUp(self):
+        self.output = io.StringIO()
+        self.stdout = PrefixedOutput(self.output)
+
+    def run_session(self, session):
+        asyncio.run(run_with_prefix(session, "S"))
+        return self.output.getvalue().splitlines()
+
+    def test_create_task_after_partial_line(self):
+        async def child():
+            self.stdout.write("child line\n")
+
+        async def session():
+            self.stdout.write("parent partial ")
+            await asyncio.create_task(child())
+            self.stdout.write("more end\n")
+
+        lines = [line for line in self.run_session(session) if line]
+        self.assertEqual(lines, ["S | child line", "S | parent partial more end"])
+
+    def test_to_thread_after_partial_line(self):
+        async def session():
+            self.stdout.write("parent partial ")
+            await asyncio.to_thread(self.stdout.write, "thread partial")
+            await asyncio.to_thread(self.stdout.write, "thread line\n")
+            self.stdout.write("more end\n")
+
+        lines = [line for line in self.run_session(session) if line]
+        self.assertEqual(lines, ["S | thread line", "S | parent partial more end"])
+
+    def test_flush_in_child_skips_parent_partial_line(self):
+        async def child():
+            self.stdout.flush()
+
+        async def session():
+            self.stdout.write("parent partial")
+            await asyncio.create_task(child())
+            self.stdout.flush()
+
+        lines = [line for line in self.run_session(session) if line]
+        self.assertEqual(lines, ["S | parent partial"])
+
+
+if __name__ == "__main__":
+    unittest.main()